@@ -0,0 +1,89 @@
+import resource
+from threading import Lock
+from time import perf_counter
+
+from config import ScraperConfig
+from parsers import OLXContentParser
+from scrappers import HouseDataScraper, HouseDetailScraper
+from scrappers.http_cache import get_page_content
+from scrappers.http_session import RECORD, REPLAY, set_http_mode
+
+
+class BenchmarkHouseDetailScraper(HouseDetailScraper):
+    """House detail scraper that measures time spent on extracting data of already downloaded detail pages"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.extract_seconds = 0.0
+        self.pages_count = 0
+        self._stats_lock = Lock()  # detail pages are scraped by a pool of threads
+
+    def scrap_detail_house_data(self, hyperlink: str) -> dict:
+        return self.extract_detail_house_data(hyperlink, get_page_content(hyperlink))
+
+    def extract_detail_house_data(self, hyperlink: str, content: bytes) -> dict:
+        start = perf_counter()
+        detail_data = super().extract_detail_house_data(hyperlink, content)
+        with self._stats_lock:
+            self.extract_seconds += perf_counter() - start
+            self.pages_count += 1
+        return detail_data
+
+
+class BenchmarkHouseDataScraper(HouseDataScraper):
+    """House data scraper that measures time spent on extracting offers of already downloaded listing pages and
+    their detail pages"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._detail_scraper = BenchmarkHouseDetailScraper()
+        self.listing_extract_seconds = 0.0
+
+    @property
+    def detail_scraper(self) -> BenchmarkHouseDetailScraper:
+        return self._detail_scraper
+
+    def extract_offers(self, content: bytes) -> list:
+        start = perf_counter()
+        offers_data = super().extract_offers(content)
+        self.listing_extract_seconds += perf_counter() - start
+        return offers_data
+
+
+def record_corpus(url: str, corpus_dir: str, max_pages: int) -> int:
+    """Scraps live listing and detail pages saving each of them to the corpus, returns number of scraped offers"""
+    ScraperConfig.CACHE_DIR = None  # every page has to be fetched to get recorded
+    ScraperConfig.ARCHIVE_DIR = None  # benchmark pages must not get into the archive reparsed into houses
+    set_http_mode(RECORD, corpus_dir)
+    return len(HouseDataScraper(url, max_pages=max_pages).scrap())
+
+
+def run_benchmark(url: str, corpus_dir: str, max_pages: int, batch: bool = False) -> dict:
+    """Replays recorded corpus through the scraper and the parser (row by row or batch mode) and measures throughput"""
+    ScraperConfig.CACHE_DIR = None
+    ScraperConfig.ARCHIVE_DIR = None
+    set_http_mode(REPLAY, corpus_dir)
+    scraper = BenchmarkHouseDataScraper(url, max_pages=max_pages)
+    offers_count = 0
+    parse_seconds = 0.0
+    start = perf_counter()
+    for page_offers in scraper.scrap_pages():
+        parse_start = perf_counter()
+        parser = OLXContentParser(page_offers)
+        offers_count += len(parser.parse_batch() if batch else parser.parse())
+        parse_seconds += perf_counter() - parse_start
+    total_seconds = perf_counter() - start
+
+    pages_count = max(scraper.pages_scanned, 1)
+    detail_pages_count = max(scraper.detail_scraper.pages_count, 1)
+    return {
+        "pages": scraper.pages_scanned,
+        "offers": offers_count,
+        "seconds": round(total_seconds, 3),
+        "pages_per_sec": round(scraper.pages_scanned / total_seconds, 2),
+        "offers_per_sec": round(offers_count / total_seconds, 2),
+        "listing_extract_ms_per_page": round(scraper.listing_extract_seconds * 1000 / pages_count, 2),
+        "detail_extract_ms_per_page": round(scraper.detail_scraper.extract_seconds * 1000 / detail_pages_count, 2),
+        "offers_parse_ms_per_page": round(parse_seconds * 1000 / pages_count, 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
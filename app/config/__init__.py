@@ -1,2 +1,3 @@
 from .celery import make_celery
-from .settings import AppConfig, Broker, DBConfig, Worker
+from .searches import SEARCHES, SearchDefinition, get_search
+from .settings import AppConfig, Broker, DashboardConfig, DBConfig, ScraperConfig, Worker
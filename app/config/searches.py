@@ -0,0 +1,43 @@
+from urllib.parse import urlencode
+
+from celery.schedules import crontab
+
+
+class SearchDefinition:
+    """OLX flats search (region and price band) scraped on its own schedule"""
+
+    BASE_URL = "https://www.olx.pl/nieruchomosci/mieszkania/sprzedaz/"
+    PRICE_FROM_FILTER = "search[filter_float_price:from]"
+    PRICE_TO_FILTER = "search[filter_float_price:to]"
+
+    def __init__(self, name: str, region: str, schedule: crontab, price_from: int = None, price_to: int = None):
+        self.name = name
+        self.region = region
+        self.schedule = schedule
+        self.price_from = price_from
+        self.price_to = price_to
+
+    @property
+    def url(self) -> str:
+        filters = {self.PRICE_FROM_FILTER: self.price_from, self.PRICE_TO_FILTER: self.price_to}
+        query = urlencode({name: value for name, value in filters.items() if value is not None})
+        return f"{self.BASE_URL}{self.region}/?{query}" if query else f"{self.BASE_URL}{self.region}/"
+
+
+SEARCHES = [
+    SearchDefinition("wielkopolskie", "wielkopolskie", crontab(minute=50, hour=18), price_to=1000000),
+    SearchDefinition("mazowieckie-low", "mazowieckie", crontab(minute=10, hour=19), price_to=600000),
+    SearchDefinition("mazowieckie-high", "mazowieckie", crontab(minute=30, hour=19), 600000, 1200000),
+    SearchDefinition("malopolskie", "malopolskie", crontab(minute=50, hour=19), price_to=1000000),
+    SearchDefinition("dolnoslaskie", "dolnoslaskie", crontab(minute=10, hour=20), price_to=1000000),
+]
+
+
+def get_search(name: str = None) -> SearchDefinition:
+    """Returns search definition by its name, the first registered search when name is not given"""
+    if name is None:
+        return SEARCHES[0]
+    for search in SEARCHES:
+        if search.name == name:
+            return search
+    raise ValueError(f"Unknown search {name}")
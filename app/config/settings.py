@@ -2,6 +2,8 @@ import os
 
 from celery.schedules import crontab
 
+from .searches import SEARCHES
+
 
 class DBConfig:
     NAME = os.environ.get("POSTGRES_DB")
@@ -10,6 +12,15 @@ class DBConfig:
     HOST = os.environ.get("POSTGRES_HOST")
     PORT = os.environ.get("POSTGRES_PORT")
     URL = f"postgresql://{USER}:{PASSWORD}@{HOST}:{PORT}/{NAME}"
+    UPSERT_CHUNK_SIZE = int(os.environ.get("DB_UPSERT_CHUNK_SIZE", 1000))
+    COPY_CHUNK_SIZE = int(os.environ.get("DB_COPY_CHUNK_SIZE", 50000))
+    PARTITION_MONTHS_AHEAD = int(os.environ.get("DB_PARTITION_MONTHS_AHEAD", 2))
+    ARCHIVE_SCHEMA = os.environ.get("DB_ARCHIVE_SCHEMA", "archive")
+
+
+class DashboardConfig:
+    SNAPSHOT_CACHE = os.environ.get("DASHBOARD_SNAPSHOT_CACHE", "true").lower() == "true"
+    SNAPSHOT_TTL = float(os.environ.get("DASHBOARD_SNAPSHOT_TTL", 60))  # seconds before data version is checked again
 
 
 class AppConfig:
@@ -18,6 +29,36 @@ class AppConfig:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
 
+class ScraperConfig:
+    MAX_PAGES = int(os.environ.get("SCRAPER_MAX_PAGES", 25))
+    HTML_PARSER = os.environ.get("SCRAPER_HTML_PARSER", "lxml")
+    MAX_WORKERS = int(os.environ.get("SCRAPER_MAX_WORKERS", 6))
+    DOMAIN_CONCURRENCY = {
+        "www.olx.pl": int(os.environ.get("SCRAPER_OLX_CONCURRENCY", 4)),
+        "www.otodom.pl": int(os.environ.get("SCRAPER_OTODOM_CONCURRENCY", 2)),
+    }
+    DOMAIN_RATE_LIMITS = {  # requests per second
+        "www.olx.pl": float(os.environ.get("SCRAPER_OLX_RATE_LIMIT", 5)),
+        "www.otodom.pl": float(os.environ.get("SCRAPER_OTODOM_RATE_LIMIT", 2)),
+    }
+    RATE_LIMIT_BURST = int(os.environ.get("SCRAPER_RATE_LIMIT_BURST", 5))
+    RUN_RESUME_HOURS = float(os.environ.get("SCRAPER_RUN_RESUME_HOURS", 12))
+    MAX_OFFER_ATTEMPTS = int(os.environ.get("SCRAPER_MAX_OFFER_ATTEMPTS", 3))
+    RATE_LIMITER = os.environ.get("SCRAPER_RATE_LIMITER", "redis")  # redis (shared by all workers) or local
+    POOL_SIZE = int(os.environ.get("SCRAPER_POOL_SIZE", 10))
+    CONNECT_TIMEOUT = float(os.environ.get("SCRAPER_CONNECT_TIMEOUT", 5))
+    READ_TIMEOUT = float(os.environ.get("SCRAPER_READ_TIMEOUT", 20))
+    RETRIES = int(os.environ.get("SCRAPER_RETRIES", 4))
+    BACKOFF_FACTOR = float(os.environ.get("SCRAPER_BACKOFF_FACTOR", 0.5))
+    BACKOFF_JITTER = float(os.environ.get("SCRAPER_BACKOFF_JITTER", 0.5))
+    CACHE_DIR = os.environ.get("SCRAPER_CACHE_DIR", "/tmp/housestats/http-cache")
+    CACHE_TTL = float(os.environ.get("SCRAPER_CACHE_TTL", 24 * 60 * 60))
+    CACHE_MAX_SIZE = int(os.environ.get("SCRAPER_CACHE_MAX_SIZE_MB", 512)) * 1024 * 1024
+    ARCHIVE_DIR = os.environ.get("SCRAPER_ARCHIVE_DIR", "/tmp/housestats/archive")
+    HTTP_MODE = os.environ.get("SCRAPER_HTTP_MODE", "live")  # live, record or replay
+    CORPUS_DIR = os.environ.get("SCRAPER_CORPUS_DIR", "/tmp/housestats/corpus")
+
+
 class Broker:
     HOST = os.environ.get("REDIS_HOST")
     PORT = os.environ.get("REDIS_PORT")
@@ -33,9 +74,23 @@ class Worker:
     imports = "tasks"
     result_expires = 30
     timezone = "Europe/Berlin"
+    task_acks_late = True  # tasks of a killed worker are redelivered and resume from their run checkpoint
+    task_reject_on_worker_lost = True
     beat_schedule = {
-        "download-olx-house": {
-            "task": "tasks.download_olx_houses",
-            "schedule": crontab(minute=50, hour=18),
-        }
+        "retry-failed-offers": {
+            "task": "tasks.retry_failed_offers",
+            "schedule": crontab(minute=0),
+        },
+        "create-houses-partitions": {
+            "task": "tasks.create_houses_partitions",
+            "schedule": crontab(hour=1, minute=30),
+        },
+        **{
+            f"download-olx-house-{search.name}": {
+                "task": "tasks.download_olx_houses",
+                "schedule": search.schedule,
+                "kwargs": {"search_name": search.name},
+            }
+            for search in SEARCHES
+        },
     }
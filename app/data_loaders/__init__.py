@@ -1,3 +1,4 @@
 from .average_houses_prices_loader import AverageHousesPricesLoader, AveragePricesParameters
 from .base_house_loader import HousesParameters
 from .city_houses_loader import CityHousesLoader
+from .houses_snapshot import HousesSnapshotCache, get_snapshot_cache
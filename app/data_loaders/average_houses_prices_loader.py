@@ -20,9 +20,14 @@ class AverageHousesPricesLoader(HouseLoader):
 
     def load_data(self, params: dict = None) -> dict:
         """Takes in params for filtering the data and returns filtered dataframe in a dict"""
-        self._start_date = params.pop(self.PARAMS.START_DATE, self._start_date)
-        self._end_date = params.pop(self.PARAMS.END_DATE, self._end_date)
-        self._average_by = params.pop(self.PARAMS.AVG_GROUP_BY, self.PARAMS.DAY)
+        params = dict(params or {})
+        self._start_date = params.pop(self.PARAMS.START_DATE, None)
+        self._end_date = params.pop(self.PARAMS.END_DATE, None)
+        self._average_by = params.pop(self.PARAMS.AVG_GROUP_BY, None) or self.PARAMS.DAY
+        if not self._start_date or not self._end_date:
+            metadata = self.get_metadata()
+            self._start_date = self._start_date or metadata.get(self.PARAMS.START_DATE)
+            self._end_date = self._end_date or metadata.get(self.PARAMS.END_DATE)
 
         data = super().load_data(params).get("plain")
         aftermarkets = data[data.market == "Aftermarket"]
@@ -40,14 +45,40 @@ class AverageHousesPricesLoader(HouseLoader):
             "aftermarket_data": aftermarkets.sort_values(by="datetime"),
         }
 
-    def _get_data_by_param(self, data: pd.DataFrame, param_name: str, param_val) -> pd.DataFrame:
-        """Takes in param name and chooses appropriate filtering function"""
+    def _get_filters(self, params: dict) -> list:
+        """Turns filtering params into (column, operation, value) filters, dates range is widened to whole time-unit
+        periods so the averages of the edge periods stay complete"""
+        period_start, _ = self._get_period_bounds(self._start_date)
+        _, next_period_start = self._get_period_bounds(self._end_date)
+        filters = [("datetime", ">=", period_start), ("datetime", "<", next_period_start)]
+        for param_name, param_val in params.items():
+            filters += self._get_filters_by_param(param_name, param_val)
+        return filters
+
+    def _get_filters_by_param(self, param_name: str, param_val) -> list:
+        """Takes in param name and chooses appropriate filters function"""
         return {
-            self.PARAMS.PRICE_FROM: self._get_data_by_price_from,
-            self.PARAMS.PRICE_TO: self._get_data_by_price_to,
-            self.PARAMS.CITY: self._get_data_by_city,
-            self.PARAMS.AREA: self._get_data_by_area,
-        }.get(param_name)(data, param_val)
+            self.PARAMS.PRICE_FROM: self._get_filters_by_price_from,
+            self.PARAMS.PRICE_TO: self._get_filters_by_price_to,
+            self.PARAMS.CITY: self._get_filters_by_city,
+            self.PARAMS.AREA: self._get_filters_by_area,
+        }.get(param_name)(param_val)
+
+    def _get_period_bounds(self, date) -> tuple:
+        """Returns start of the given time-unit period that contains the date and start of the next period"""
+        day = pd.Timestamp(date).normalize()
+        year_start, next_year_start = day.replace(month=1, day=1), day.replace(year=day.year + 1, month=1, day=1)
+        days_since_sunday = (day.dayofweek + 1) % 7  # weeks of "%Y-%U" format start on sunday and split on new year
+        period_bounds = {
+            self.PARAMS.DAY: (day, day + pd.Timedelta(days=1)),
+            self.PARAMS.WEEK: (
+                max(day - pd.Timedelta(days=days_since_sunday), year_start),
+                min(day + pd.Timedelta(days=7 - days_since_sunday), next_year_start),
+            ),
+            self.PARAMS.MONTH: (day.replace(day=1), day.replace(day=1) + pd.offsets.MonthBegin(1)),
+            self.PARAMS.YEAR: (year_start, next_year_start),
+        }.get(self._average_by)
+        return tuple(bound.to_pydatetime() for bound in period_bounds)
 
     def _get_data_between_dates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Filters dataframe by start date and end date"""
@@ -56,15 +87,11 @@ class AverageHousesPricesLoader(HouseLoader):
 
     def _get_data_by_start_date(self, df: pd.DataFrame) -> pd.DataFrame:
         """Filters dateframe by start date (returns only records with datetime greater than start date)"""
-        if not self._start_date:
-            self._start_date = self.get_metadata().get(self.PARAMS.START_DATE)
         start_date = self._change_single_date_format(self._start_date)
         return df[(df["datetime"] >= start_date)]
 
     def _get_data_by_end_date(self, df: pd.DataFrame) -> pd.DataFrame:
         """Filters dateframe by end date (returns only records with datetime less than end date)"""
-        if not self._end_date:
-            self._end_date = self.get_metadata().get(self.PARAMS.END_DATE)
         end_date = self._change_single_date_format(self._end_date)
         return df[(df["datetime"] <= end_date)]
 
@@ -1,9 +1,14 @@
 from datetime import date, timedelta
+from threading import Lock
 
 import pandas as pd
-from db.house_tools import get_houses
+from db.house_tools import get_houses_summary, read_houses_frame
 
 from .base_loader import DataLoader
+from .houses_snapshot import HOUSES_DTYPES, get_current_data_version, get_snapshot_cache
+
+_metadata = {}
+_metadata_lock = Lock()
 
 
 class HousesParameters:
@@ -21,85 +26,93 @@ class HouseLoader(DataLoader):
     """Loads data from house table and puts it into the DataFrame"""
 
     PARAMS = HousesParameters
-    _end_date = None
-    _start_date = None
+    DTYPES = HOUSES_DTYPES
 
     def load_data(self, params: dict = None) -> dict:
         """Takes in params for filtering the data and returns filtered dataframe in a dict"""
-        self._data = self._get_data()
-
-        data = self._data
-        for param_name, param_val in params.items():
-            data = self._get_data_by_param(data, param_name, param_val)
+        params = dict(params or {})
+        self._data = self._get_data(self._get_filters(params))
         return {
-            "plain": data,
+            "plain": self._data,
         }
 
     def get_metadata(self) -> dict:
-        """Calculates universal class metadata that does not depend on filtering params"""
-        datetimes = self._data.datetime
-        latest_date = datetimes.max().date()
+        """Returns universal class metadata that does not depend on filtering params, memoized per data version and
+        day for all loaders of the process"""
+        key = (get_current_data_version(), date.today())
+        with _metadata_lock:
+            if key not in _metadata:
+                _metadata.clear()
+                _metadata[key] = self._calculate_metadata()
+            return dict(_metadata[key])
+
+    def _calculate_metadata(self) -> dict:
+        """Calculates universal class metadata with aggregate queries"""
         start_date = date.today() - timedelta(days=2)
-        if not any(self._get_data_by_date(self._data, start_date)):
+        summary = get_houses_summary(start_date)
+        latest_date = summary["max_datetime"].date()
+        if not summary["has_recent"]:
             start_date = latest_date
 
         return {
-            "min-date": datetimes.min().date(),
+            "min-date": summary["min_datetime"].date(),
             "max-date": latest_date,
             "start_date": start_date,
             "end_date": latest_date,
-            "areas": self._data.area.notnull().unique(),
-            "available_cities": self._data.location_city.unique(),
+            "areas": [summary["min_area"], summary["max_area"]],
+            "available_cities": summary["cities"],
         }
 
-    def _get_data_by_param(self, data: pd.DataFrame, param_name: str, param_val) -> pd.DataFrame:
-        """Takes in param name and chooses appropriate filtering function"""
+    def _get_filters(self, params: dict) -> list:
+        """Turns filtering params into (column, operation, value) filters, missing dates are filled with metadata
+        defaults"""
+        params.setdefault(self.PARAMS.START_DATE, None)
+        params.setdefault(self.PARAMS.END_DATE, None)
+        filters = []
+        for param_name, param_val in params.items():
+            filters += self._get_filters_by_param(param_name, param_val)
+        return filters
+
+    def _get_filters_by_param(self, param_name: str, param_val) -> list:
+        """Takes in param name and chooses appropriate filters function"""
         return {
-            self.PARAMS.START_DATE: self._get_data_by_start_date,
-            self.PARAMS.END_DATE: self._get_data_by_end_date,
-            self.PARAMS.CITY: self._get_data_by_city,
-            self.PARAMS.PRICE_FROM: self._get_data_by_price_from,
-            self.PARAMS.PRICE_TO: self._get_data_by_price_to,
-            self.PARAMS.AREA: self._get_data_by_area,
-        }.get(param_name)(data, param_val)
-
-    def _get_data(self) -> pd.DataFrame:
-        """Loads data into the dataframe"""
-        return pd.DataFrame(h.__dict__ for h in get_houses())
-
-    def _get_data_by_date(self, df: pd.DataFrame, filter_date: str) -> pd.DataFrame:
-        """Filters dataframe by date"""
-        return df[df["datetime"].dt.date == pd.Timestamp(filter_date)]
-
-    def _get_data_by_start_date(self, df: pd.DataFrame, start_date: str) -> pd.DataFrame:
-        """Filters dateframe by start date (returns only records with datetime greater than start date)"""
-        if not self._start_date and not start_date:
-            self._start_date = self.get_metadata().get(self.PARAMS.START_DATE)
-        elif not self._start_date:
-            self._start_date = start_date
-        return df[(df["datetime"].dt.date >= pd.Timestamp(self._start_date))]
-
-    def _get_data_by_end_date(self, df: pd.DataFrame, end_date: str) -> pd.DataFrame:
-        """Filters dateframe by end date (returns only records with datetime less than end date)"""
-        if not self._end_date and not end_date:
-            self._end_date = self.get_metadata().get(self.PARAMS.END_DATE)
-        elif not self._end_date:
-            self._end_date = end_date
-        return df[(df["datetime"].dt.date <= pd.Timestamp(self._end_date))]
-
-    def _get_data_by_city(self, df: pd.DataFrame, cities: list) -> pd.DataFrame:
-        """Filters dateframe by city"""
-        return df[df["location_city"].isin(cities)]
-
-    def _get_data_by_price_from(self, df: pd.DataFrame, price_from: float) -> pd.DataFrame:
-        """Filters dateframe by price from (returns only records with price greater than price from)"""
-        return df[df["price"] >= price_from]
-
-    def _get_data_by_price_to(self, df: pd.DataFrame, price_to: float) -> pd.DataFrame:
-        """Filters dateframe by price to (returns only records with price less than price to)"""
-        return df[df["price"] <= price_to]
-
-    def _get_data_by_area(self, df: pd.DataFrame, area_range: tuple) -> pd.DataFrame:
-        """Filters dateframe by area range"""
-        mask = (df["area"] > float(area_range[0])) & (df["area"] <= float(area_range[1]))
-        return df.loc[mask]
+            self.PARAMS.START_DATE: self._get_filters_by_start_date,
+            self.PARAMS.END_DATE: self._get_filters_by_end_date,
+            self.PARAMS.CITY: self._get_filters_by_city,
+            self.PARAMS.PRICE_FROM: self._get_filters_by_price_from,
+            self.PARAMS.PRICE_TO: self._get_filters_by_price_to,
+            self.PARAMS.AREA: self._get_filters_by_area,
+        }.get(param_name)(param_val)
+
+    def _get_data(self, filters: list) -> pd.DataFrame:
+        """Loads houses matching filters into the dataframe, from the shared snapshot when it is enabled or with SQL"""
+        snapshot_cache = get_snapshot_cache()
+        if snapshot_cache:
+            return snapshot_cache.filter_frame(filters)
+        return read_houses_frame(filters, self.DTYPES)
+
+    def _get_filters_by_start_date(self, start_date: str) -> list:
+        """Selects only records with datetime on start date or later"""
+        start_date = start_date or self.get_metadata().get(self.PARAMS.START_DATE)
+        return [("datetime", ">=", pd.Timestamp(start_date).normalize().to_pydatetime())]
+
+    def _get_filters_by_end_date(self, end_date: str) -> list:
+        """Selects only records with datetime on end date or earlier"""
+        end_date = end_date or self.get_metadata().get(self.PARAMS.END_DATE)
+        return [("datetime", "<", (pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1)).to_pydatetime())]
+
+    def _get_filters_by_city(self, cities: list) -> list:
+        """Selects records by city"""
+        return [("location_city", "in", cities)]
+
+    def _get_filters_by_price_from(self, price_from: float) -> list:
+        """Selects only records with price greater than price from"""
+        return [("price", ">=", price_from)]
+
+    def _get_filters_by_price_to(self, price_to: float) -> list:
+        """Selects only records with price less than price to"""
+        return [("price", "<=", price_to)]
+
+    def _get_filters_by_area(self, area_range: tuple) -> list:
+        """Selects records by area range"""
+        return [("area", ">", float(area_range[0])), ("area", "<=", float(area_range[1]))]
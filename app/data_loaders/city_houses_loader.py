@@ -14,9 +14,9 @@ class CityHousesLoader(HouseLoader):
             "plain": data.sort_values(by="datetime"),
         }
 
-    def _get_data(self) -> pd.DataFrame:
-        """Takes params for loading the data, add additional price column and returns it as a dict"""
-        df = super()._get_data()
+    def _get_data(self, filters: list) -> pd.DataFrame:
+        """Takes filters for loading the data, add additional price column and returns it as a dict"""
+        df = super()._get_data(filters)
         df = df.dropna(subset=["price", "area", "market"])
         df["price_mk"] = self._calculate_price_per_meter(df)
         return df
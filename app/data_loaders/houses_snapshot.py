@@ -0,0 +1,88 @@
+from threading import Lock
+from time import monotonic
+
+import pandas as pd
+from config import DashboardConfig
+from db.data_version_tools import HOUSES_VERSION, get_data_version
+from db.house_tools import FILTER_OPERATORS, read_houses_frame
+
+HOUSES_DTYPES = {  # only columns used by the pages, in compact types
+    "name": "object",
+    "datetime": "datetime64[ns]",
+    "price": "float32",
+    "area": "float32",
+    "rooms_count": "Int16",
+    "building_type": "category",
+    "website": "object",
+    "location_city": "category",
+    "location_region": "category",
+    "market": "category",
+}
+
+
+class HousesSnapshotCache:
+    """Process-wide snapshot of the houses dataframe shared by all loaders, reloaded when houses data version changes"""
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._lock = Lock()
+        self._frame = None
+        self._version = None
+        self._checked_version = None
+        self._checked_at = 0.0
+
+    def current_version(self) -> int:
+        """Returns houses data version checked once the ttl has passed since the last check, without loading the
+        snapshot"""
+        with self._lock:
+            return self._check_version()
+
+    def get_frame(self) -> pd.DataFrame:
+        """Returns houses snapshot, reloaded when data version checked once per ttl has changed"""
+        with self._lock:
+            version = self._check_version()
+            if self._frame is None or version != self._version:
+                self._frame = read_houses_frame([], HOUSES_DTYPES)
+                self._version = version
+            return self._frame
+
+    def filter_frame(self, filters: list) -> pd.DataFrame:
+        """Returns copy of the snapshot rows matching all (column, operation, value) filters"""
+        frame = self.get_frame()
+        mask = pd.Series(True, index=frame.index)
+        for column, operation, value in filters:
+            if operation == "in":
+                mask &= frame[column].isin(value)
+            else:
+                mask &= FILTER_OPERATORS[operation](frame[column], value)
+        return frame[mask]
+
+    def _check_version(self) -> int:
+        """Reads houses data version from the database once the ttl has passed, must be called under the lock"""
+        if self._checked_version is None or monotonic() - self._checked_at > self._ttl:
+            self._checked_version = get_data_version(HOUSES_VERSION)
+            self._checked_at = monotonic()
+        return self._checked_version
+
+
+_snapshot_cache = None
+_snapshot_cache_lock = Lock()
+
+
+def get_snapshot_cache() -> HousesSnapshotCache:
+    """Returns process-wide houses snapshot cache, None when snapshot caching is disabled"""
+    global _snapshot_cache
+    if not DashboardConfig.SNAPSHOT_CACHE:
+        return None
+    with _snapshot_cache_lock:
+        if _snapshot_cache is None:
+            _snapshot_cache = HousesSnapshotCache(DashboardConfig.SNAPSHOT_TTL)
+        return _snapshot_cache
+
+
+def get_current_data_version() -> int:
+    """Returns houses data version, of the shared snapshot when snapshot caching is enabled (checked once per ttl)"""
+    snapshot_cache = get_snapshot_cache()
+    if snapshot_cache:
+        return snapshot_cache.current_version()
+    return get_data_version(HOUSES_VERSION)
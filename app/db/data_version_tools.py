@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy.dialects.postgresql import insert
+
+from .models import DataVersion, db
+
+DATA_VERSION_MODEL = DataVersion
+HOUSES_VERSION = "houses"
+
+
+def bump_data_version(name: str) -> None:
+    """Increments version of the named data, so the caches built from it get reloaded"""
+    statement = insert(DATA_VERSION_MODEL.__table__).values(name=name, version=1, updated_at=datetime.now())
+    statement = statement.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"version": DATA_VERSION_MODEL.version + 1, "updated_at": statement.excluded.updated_at},
+    )
+    db.session.execute(statement)
+    db.session.commit()
+
+
+def get_data_version(name: str) -> int:
+    """Returns current version of the named data, 0 if it has never changed"""
+    data_version = DATA_VERSION_MODEL.query.get(name)
+    return data_version.version if data_version else 0
@@ -1,3 +1,12 @@
+import csv
+import io
+import json
+from itertools import islice
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+
 from .models import db
 
 
@@ -19,6 +28,105 @@ def bulk_update(model, objects: list) -> None:
     db.session.commit()
 
 
+def upsert(model, key_model, objects: list, index_elements: list, order_by: str) -> dict:
+    """Creates dicts as model records or updates existing records matched by index elements with values that are not
+    None, unless the existing record has greater order by column, returns numbers of created and updated records.
+    Index elements are kept unique by the key model table and records take ids of their keys, objects must not
+    repeat the same index elements"""
+    if not objects:
+        return {"created": 0, "updated": 0}
+    key_ids = _upsert_keys(key_model, objects, index_elements)
+    objects = [{**obj, "id": key_ids[tuple(obj[column] for column in index_elements)]} for obj in objects]
+    table = model.__table__.name
+    source = f"SELECT * FROM jsonb_populate_recordset(NULL::{table}, CAST(:objects AS jsonb))"
+    created_count, updated_count = db.session.execute(
+        text(_get_merge_query(table, _get_value_columns(model), source, order_by)),
+        {"objects": json.dumps(objects, default=str)},
+    ).one()
+    db.session.commit()
+    return {"created": created_count, "updated": updated_count}
+
+
+def _upsert_keys(key_model, objects: list, index_elements: list) -> dict:
+    """Inserts missing keys of dicts with ON CONFLICT and locks existing ones till the end of transaction, so
+    concurrent upserts of the same records wait for each other, returns key ids by index elements values"""
+    keys = sorted({tuple(obj[column] for column in index_elements) for obj in objects})  # the same locking order
+    key_table = key_model.__table__
+    statement = insert(key_table).values([dict(zip(index_elements, key)) for key in keys])
+    statement = statement.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={column: statement.excluded[column] for column in index_elements},  # no-op update takes the row lock
+    ).returning(key_table.c.id, *(key_table.c[column] for column in index_elements))
+    return {tuple(key): key_id for key_id, *key in db.session.execute(statement)}
+
+
+def copy_upsert(model, key_model, objects: Iterable, index_elements: list, order_by: str, chunk_size: int) -> dict:
+    """Streams dicts to temporary staging table with COPY in chunks and merges them into model table, keys are
+    upserted into the key model table first, from duplicates within the stream and the stored record the one with the
+    greatest order by column wins, returns created and updated records counts"""
+    table = model.__table__.name
+    key_table = key_model.__table__.name
+    columns = _get_value_columns(model)
+    columns_text = ", ".join(columns)
+    index_text = ", ".join(index_elements)
+    key_updates_text = ", ".join(f"{column} = EXCLUDED.{column}" for column in index_elements)
+    cursor = db.session.connection().connection.cursor()  # COPY is available only on the raw psycopg2 cursor
+    cursor.execute(
+        f"CREATE TEMP TABLE {table}_staging ON COMMIT DROP AS SELECT {columns_text} FROM {table} WITH NO DATA"
+    )
+
+    objects = iter(objects)
+    while chunk := list(islice(objects, chunk_size)):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows([obj.get(column) for column in columns] for obj in chunk)
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {table}_staging ({columns_text}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+    cursor.execute(
+        f"""
+        INSERT INTO {key_table} ({index_text})
+        SELECT DISTINCT {index_text} FROM {table}_staging ORDER BY {index_text}
+        ON CONFLICT ({index_text}) DO UPDATE SET {key_updates_text}
+        """
+    )  # same as _upsert_keys, merge runs as the next statement to see keys and records committed meanwhile
+    source = f"""
+        SELECT DISTINCT ON ({key_table}.id) {key_table}.id, {", ".join(f"{table}_staging.{c}" for c in columns)}
+        FROM {table}_staging JOIN {key_table} USING ({index_text})
+        ORDER BY {key_table}.id, {table}_staging.{order_by} DESC
+    """
+    cursor.execute(_get_merge_query(table, columns, source, order_by))
+    created_count, updated_count = cursor.fetchone()
+    db.session.commit()
+    return {"created": created_count, "updated": updated_count}
+
+
+def _get_value_columns(model) -> list:
+    """Returns model table columns other than the id taken from the key"""
+    return [column.name for column in model.__table__.columns if column.name != "id"]
+
+
+def _get_merge_query(table: str, columns: list, source: str, order_by: str) -> str:
+    """Builds query merging records with key ids selected by the source query into the table, records are matched by
+    id, so an update can move the record to other partition, older records (by order by column) never overwrite
+    newer ones, counts only records whose values have changed"""
+    columns_text = ", ".join(columns)
+    return f"""
+        WITH incoming AS ({source}), updated AS (
+            UPDATE {table} SET {", ".join(f"{c} = COALESCE(incoming.{c}, {table}.{c})" for c in columns)}
+            FROM incoming
+            WHERE {table}.id = incoming.id AND incoming.{order_by} >= {table}.{order_by}
+            AND ({" OR ".join(f"COALESCE(incoming.{c}, {table}.{c}) IS DISTINCT FROM {table}.{c}" for c in columns)})
+            RETURNING 1
+        ), inserted AS (
+            INSERT INTO {table} (id, {columns_text})
+            SELECT id, {columns_text} FROM incoming
+            WHERE NOT EXISTS (SELECT FROM {table} WHERE {table}.id = incoming.id)
+            RETURNING 1
+        )
+        SELECT (SELECT count(*) FROM inserted), (SELECT count(*) FROM updated)
+    """
+
+
 def remove_all(model) -> None:
     """Removes all model records from db"""
     db.session.query(model).delete()
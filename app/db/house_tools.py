@@ -1,8 +1,22 @@
-from typing import Callable
-from .db_tools import bulk_add, bulk_update, get_all, remove, remove_all
-from .models import House
+import io
+import operator
+from datetime import date, timedelta
+from itertools import islice
+from typing import Callable, Iterable
+
+import pandas as pd
+from config import DBConfig
+from sqlalchemy import func, select, tuple_
+
+from .data_version_tools import HOUSES_VERSION, bump_data_version
+from .db_tools import copy_upsert, get_all, remove, remove_all, upsert
+from .models import House, HouseKey, db
 
 HOUSE_MODEL = House
+HOUSE_KEY_MODEL = HouseKey
+HOUSE_INDEX_ELEMENTS = ["name", "website"]
+HOUSES_TABLE = House.__table__
+FILTER_OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le}
 
 
 def get_houses_by_name(houses: list) -> list:
@@ -11,25 +25,14 @@ def get_houses_by_name(houses: list) -> list:
     return HOUSE_MODEL.query.filter(House.name.in_(houses_names)).all()
 
 
-def prepare_houses_to_create(houses: list, existing_houses: list) -> list:
-    """Returns only the houses that does not yet exist"""
-    return [
-        house
-        for house in houses
-        if not any(house["name"].lower() == existing_house.name.lower() for existing_house in existing_houses)
-    ]
-
-
-def prepare_houses_to_update(houses: list, existing_houses: list) -> list:
-    """Returns only already existing houses"""
-    houses_for_update = []
-    for house in houses:
-        for existing_house in existing_houses:
-            if house["name"] == existing_house.name:
-                house.update(vars(existing_house))
-                houses_for_update.append(house)
-                break
-    return houses_for_update
+def get_houses_datetimes(offers: list) -> dict:
+    """Maps websites of those of given offers that are already stored in db to their datetime, offers are looked up
+    by their (name, website) pairs on the houses name and website index (single batched query)"""
+    offers_keys = {(offer["name"], offer["website"]) for offer in offers}
+    known_houses = HOUSE_MODEL.query.with_entities(HOUSE_MODEL.website, HOUSE_MODEL.datetime).filter(
+        tuple_(HOUSE_MODEL.name, HOUSE_MODEL.website).in_(offers_keys)
+    )
+    return {str(website): house_datetime for website, house_datetime in known_houses}
 
 
 def remove_duplicates(iterable: list, key: Callable = None) -> str:
@@ -47,16 +50,48 @@ def remove_duplicates(iterable: list, key: Callable = None) -> str:
         seen.add(k)
 
 
-def add_new_houses(houses: list) -> list:
-    """Takes in list of houses dicts and create/update (if existing) the house database"""
-    existing_houses = get_houses_by_name(houses)
-    houses_for_create = prepare_houses_to_create(houses, existing_houses)
-    unique_houses = remove_duplicates(houses_for_create, lambda d: (d["name"], d["website"]))
-    bulk_add(HOUSE_MODEL, unique_houses)
-
-    houses_for_update = prepare_houses_to_update(houses, existing_houses)
-    bulk_update(HOUSE_MODEL, houses_for_update)
-    return get_houses_by_name(unique_houses)
+def add_new_houses(houses: list) -> dict:
+    """Takes in list of houses dicts and create/update (if existing) the house database, returns created and updated
+    houses counts"""
+    latest_houses = sorted(houses, key=lambda d: d["datetime"], reverse=True)  # latest of duplicated houses is kept
+    unique_houses = list(remove_duplicates(latest_houses, lambda d: (d["name"], d["website"])))
+    saved_counts = upsert(HOUSE_MODEL, HOUSE_KEY_MODEL, unique_houses, HOUSE_INDEX_ELEMENTS, order_by="datetime")
+    _bump_houses_version(saved_counts)
+    return saved_counts
+
+
+def add_new_houses_in_chunks(houses: Iterable, chunk_size: int = None) -> dict:
+    """Consumes houses dicts iterable and creates/updates them in chunks, returns created and updated houses counts"""
+    houses = iter(houses)
+    chunk_size = chunk_size or DBConfig.UPSERT_CHUNK_SIZE
+    counts = {"created": 0, "updated": 0}
+    while chunk := list(islice(houses, chunk_size)):
+        for name, count in add_new_houses(chunk).items():
+            counts[name] += count
+        print(f"Saved {counts['created']} new and {counts['updated']} updated houses...")
+    return counts
+
+
+def bulk_ingest_houses(houses: Iterable, chunk_size: int = None) -> dict:
+    """Loads large houses dicts iterable with COPY through a staging table and creates/updates them in one merge,
+    returns created and updated houses counts"""
+    saved_counts = copy_upsert(
+        HOUSE_MODEL,
+        HOUSE_KEY_MODEL,
+        houses,
+        HOUSE_INDEX_ELEMENTS,
+        order_by="datetime",
+        chunk_size=chunk_size or DBConfig.COPY_CHUNK_SIZE,
+    )
+    _bump_houses_version(saved_counts)
+    return saved_counts
+
+
+def _bump_houses_version(saved_counts: dict) -> None:
+    """Bumps houses data version only when any house was created or updated, so the dashboard caches survive
+    scraping runs that brought nothing new"""
+    if saved_counts["created"] + saved_counts["updated"] > 0:
+        bump_data_version(HOUSES_VERSION)
 
 
 def get_houses() -> list:
@@ -64,11 +99,59 @@ def get_houses() -> list:
     return get_all(HOUSE_MODEL)
 
 
+def get_sql_conditions(filters: list) -> list:
+    """Turns (column, operation, value) filters into SQL conditions on houses table"""
+    columns = HOUSES_TABLE.c
+    return [
+        columns[column].in_(value) if operation == "in" else FILTER_OPERATORS[operation](columns[column], value)
+        for column, operation, value in filters
+    ]
+
+
+def read_houses_frame(filters: list, dtypes: dict) -> pd.DataFrame:
+    """Streams columns of given dtypes of the houses matching all (column, operation, value) filters through COPY into
+    the dataframe, without building ORM objects"""
+    date_columns = [column for column, dtype in dtypes.items() if dtype.startswith("datetime")]
+    query = select(*(HOUSES_TABLE.c[column] for column in dtypes)).where(*get_sql_conditions(filters))
+    compiled = query.compile(dialect=db.session.get_bind().dialect, compile_kwargs={"render_postcompile": True})
+    cursor = db.session.connection().connection.cursor()  # COPY is available only on the raw psycopg2 cursor
+    query_text = cursor.mogrify(str(compiled), compiled.params).decode()  # COPY query cannot take bind parameters
+    buffer = io.StringIO()
+    cursor.copy_expert(f"COPY ({query_text}) TO STDOUT WITH CSV HEADER", buffer)
+    buffer.seek(0)
+    return pd.read_csv(
+        buffer,
+        dtype={column: dtype for column, dtype in dtypes.items() if column not in date_columns},
+        parse_dates=date_columns,
+    )
+
+
+def get_houses_summary(recent_date: date) -> dict:
+    """Calculates houses datetimes and areas ranges, cities and whether there are houses dated on recent date"""
+    columns = HOUSES_TABLE.c
+    is_recent = select(columns.id).where(
+        columns.datetime >= recent_date, columns.datetime < recent_date + timedelta(days=1)
+    )
+    summary = db.session.execute(
+        select(
+            func.min(columns.datetime).label("min_datetime"),
+            func.max(columns.datetime).label("max_datetime"),
+            func.min(columns.area).label("min_area"),
+            func.max(columns.area).label("max_area"),
+            is_recent.exists().label("has_recent"),
+        )
+    ).one()
+    cities = db.session.execute(select(columns.location_city).distinct().order_by(columns.location_city)).scalars()
+    return {**summary._asdict(), "cities": cities.all()}
+
+
 def remove_all_houses() -> None:
     """Removes all house records from db"""
     remove_all(HOUSE_MODEL)
+    bump_data_version(HOUSES_VERSION)
 
 
 def remove_house_by_name(house_name: str) -> None:
     """Removes house from db by its name"""
     remove(HOUSE_MODEL, house_name)
+    bump_data_version(HOUSES_VERSION)
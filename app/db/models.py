@@ -1,18 +1,42 @@
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DDL, event
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy_utils import URLType
 
 db = SQLAlchemy()
 migrate = Migrate()
 
 
+class HouseKey(db.Model):
+    __tablename__ = "house_keys"
+    __table_args__ = (  # partitioned houses table cannot keep (name, website) unique itself
+        db.UniqueConstraint("name", "website", name="house_keys_name_website_key"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    name = db.Column(db.String(), nullable=False)
+    website = db.Column(URLType, nullable=False)
+
+    def __repr__(self):
+        return f'{self.id}: "{self.name}" ({self.website})'
+
+
 class House(db.Model):
     __tablename__ = "houses"
-    __table_args__ = (db.UniqueConstraint("name", "website"),)
+    __table_args__ = (
+        db.Index("ix_houses_name_website", "name", "website"),  # unique through house_keys
+        db.Index("ix_houses_datetime_brin", "datetime", postgresql_using="brin"),
+        db.Index("ix_houses_location_city_datetime", "location_city", "datetime"),
+        db.Index("ix_houses_market_datetime", "market", "datetime"),
+        db.Index("ix_houses_price", "price"),
+        db.Index("ix_houses_area", "area"),
+        {"postgresql_partition_by": "RANGE (datetime)"},  # monthly partitions, see db.partition_tools
+    )
 
-    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # id of the house key
     name = db.Column(db.String(), nullable=False)
-    datetime = db.Column(db.DateTime, nullable=False)
+    datetime = db.Column(db.DateTime, primary_key=True, nullable=False)
     area = db.Column(db.Float, nullable=True)
     rooms_count = db.Column(db.Integer, nullable=True)
     building_type = db.Column(db.String(), nullable=True)
@@ -24,3 +48,45 @@ class House(db.Model):
 
     def __repr__(self):
         return f'{self.id}: "{self.name}" ({self.rooms_count} pokoje) - {self.price} zł'
+
+
+event.listen(  # rows outside of created monthly partitions are kept by the default one
+    House.__table__, "after_create", DDL("CREATE TABLE houses_default PARTITION OF houses DEFAULT")
+)
+
+
+class ScrapeRun(db.Model):
+    __tablename__ = "scrape_runs"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    search_name = db.Column(db.String(), nullable=False, index=True)
+    started_at = db.Column(db.DateTime, nullable=False)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    discovered_at = db.Column(db.DateTime, nullable=True)  # set once all pages of the run are scheduled
+    scheduled_pages = db.Column(ARRAY(db.Integer), nullable=False, default=list)
+    completed_pages = db.Column(ARRAY(db.Integer), nullable=False, default=list)
+    failed_offers = db.Column(JSONB, nullable=False, default=list)
+    page_results = db.Column(JSONB, nullable=False, default=list)
+
+    @property
+    def checkpoint_page(self) -> int:
+        """Last page number up to which every page has been completed"""
+        completed_pages = set(self.completed_pages)
+        page_num = 0
+        while page_num + 1 in completed_pages:
+            page_num += 1
+        return page_num
+
+    def __repr__(self):
+        return f'{self.id}: "{self.search_name}" run started {self.started_at} (checkpoint page {self.checkpoint_page})'
+
+
+class DataVersion(db.Model):
+    __tablename__ = "data_versions"
+
+    name = db.Column(db.String(), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f'"{self.name}" data version {self.version} ({self.updated_at})'
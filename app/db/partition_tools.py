@@ -0,0 +1,89 @@
+import re
+from datetime import date
+
+from sqlalchemy import text
+
+from .data_version_tools import HOUSES_VERSION, bump_data_version
+from .models import House, db
+
+HOUSES_TABLE = House.__tablename__
+DEFAULT_PARTITION = f"{HOUSES_TABLE}_default"
+PARTITION_NAME_PATTERN = re.compile(rf"^{HOUSES_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+
+def get_month_start(day: date, months_offset: int = 0) -> date:
+    """Returns first day of the day month moved by given number of months"""
+    month_index = day.year * 12 + day.month - 1 + months_offset
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def get_partition_name(month_start: date) -> str:
+    """Returns name of the houses partition for given month"""
+    return f"{HOUSES_TABLE}_y{month_start.year}m{month_start.month:02d}"
+
+
+def get_month_partitions() -> dict:
+    """Maps names of monthly partitions attached to houses table to their months first days"""
+    partitions_names = db.session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": HOUSES_TABLE},
+    ).scalars()
+    return {
+        name: date(int(match.group(1)), int(match.group(2)), 1)
+        for name in partitions_names
+        if (match := PARTITION_NAME_PATTERN.match(name))
+    }
+
+
+def create_month_partitions(months_ahead: int, since: date = None) -> list:
+    """Creates missing monthly partitions from the month of since date (current month by default) to months ahead,
+    rows of those months that already landed in the default partition are moved to them, returns created names"""
+    existing_partitions = get_month_partitions()
+    first_month = get_month_start(since or date.today())
+    created_partitions = []
+    for months_offset in range(months_ahead + 1):
+        month_start = get_month_start(first_month, months_offset)
+        name = get_partition_name(month_start)
+        if name in existing_partitions:
+            continue
+        bounds = {"month_start": month_start, "month_end": get_month_start(month_start, 1)}
+        db.session.execute(text(f"CREATE TABLE {name} (LIKE {HOUSES_TABLE} INCLUDING DEFAULTS)"))
+        db.session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                "WHERE datetime >= :month_start AND datetime < :month_end RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            bounds,
+        )
+        db.session.execute(
+            text(
+                f"ALTER TABLE {HOUSES_TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{bounds['month_start']}') TO ('{bounds['month_end']}')"
+            )
+        )
+        created_partitions.append(name)
+    db.session.commit()
+    return created_partitions
+
+
+def detach_month_partitions(before: date, archive_schema: str = None) -> list:
+    """Detaches monthly partitions that end before given date (moves them to archive schema if it is given), their
+    rows stay in the detached tables but no longer take part in houses queries, returns detached names"""
+    detached_partitions = []
+    for name, month_start in sorted(get_month_partitions().items()):
+        if get_month_start(month_start, 1) > before:
+            continue
+        db.session.execute(text(f"ALTER TABLE {HOUSES_TABLE} DETACH PARTITION {name}"))
+        if archive_schema:
+            db.session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+            db.session.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive_schema}"))
+        detached_partitions.append(name)
+    db.session.commit()
+    bump_data_version(HOUSES_VERSION)
+    return detached_partitions
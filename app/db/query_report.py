@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from sqlalchemy import func, select
+
+from .models import House, db
+
+HOUSES_TABLE = House.__table__
+
+
+def get_dashboard_queries(days: int = 30) -> dict:
+    """Returns standard dashboard queries over the latest days window, mapped to their names"""
+    columns = HOUSES_TABLE.c
+    window = columns.datetime.between(datetime.now() - timedelta(days=days), datetime.now())
+    return {
+        "latest window": select(HOUSES_TABLE).where(window),
+        "city window": select(HOUSES_TABLE).where(window, columns.location_city.in_(["Poznań", "Warszawa"])),
+        "city price area window": select(HOUSES_TABLE).where(
+            window,
+            columns.location_city.in_(["Poznań"]),
+            columns.price.between(200000, 600000),
+            columns.area > 40,
+            columns.area <= 80,
+        ),
+        "market window": select(HOUSES_TABLE).where(window, columns.market == "Aftermarket"),
+        "dates range": select(func.min(columns.datetime), func.max(columns.datetime)),
+        "cities": select(columns.location_city).distinct(),
+    }
+
+
+def explain_dashboard_queries(days: int = 30, analyze: bool = False) -> dict:
+    """Runs EXPLAIN (with ANALYZE if chosen) for standard dashboard queries and returns their plans texts"""
+    connection = db.session.connection()
+    explain = "EXPLAIN (ANALYZE, BUFFERS)" if analyze else "EXPLAIN"
+    plans = {}
+    for name, query in get_dashboard_queries(days).items():
+        compiled = query.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+        plan_rows = connection.exec_driver_sql(f"{explain} {compiled}", compiled.params)
+        plans[name] = "\n".join(row for row, in plan_rows)
+    db.session.rollback()  # ANALYZE really runs the queries, nothing of them should stay in the session
+    return plans
+
+
+def measure_frame_load(read_frame, filters: list) -> dict:
+    """Loads houses matching filters with given read function and measures its time and dataframe size"""
+    start = perf_counter()
+    frame = read_frame(filters)
+    return {
+        "rows": len(frame),
+        "seconds": round(perf_counter() - start, 3),
+        "frame_mb": round(frame.memory_usage(deep=True).sum() / 1024 / 1024, 1),
+    }
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import Integer, func, literal
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+from .models import ScrapeRun, db
+
+SCRAPE_RUN_MODEL = ScrapeRun
+
+
+def start_or_resume_run(search_name: str, resume_hours: float) -> ScrapeRun:
+    """Returns unfinished run of the search started within resume hours, abandons older ones and starts a new run,
+    pages of the returned run are discovered again, so it cannot finish before its discovery is finished"""
+    now = datetime.now()
+    unfinished_runs = SCRAPE_RUN_MODEL.query.filter(
+        SCRAPE_RUN_MODEL.search_name == search_name, SCRAPE_RUN_MODEL.finished_at.is_(None)
+    ).order_by(SCRAPE_RUN_MODEL.started_at.desc())
+    for run in unfinished_runs:
+        if run.started_at >= now - timedelta(hours=resume_hours):
+            run.discovered_at = None
+            db.session.commit()
+            return run
+        run.finished_at = now
+
+    run = SCRAPE_RUN_MODEL(
+        search_name=search_name,
+        started_at=now,
+        scheduled_pages=[],
+        completed_pages=[],
+        failed_offers=[],
+        page_results=[],
+    )
+    db.session.add(run)
+    db.session.commit()
+    return run
+
+
+def schedule_pages(run_id: int, pages_nums: list) -> None:
+    """Atomically adds pages to the run pages that have to be completed before the run is finished"""
+    SCRAPE_RUN_MODEL.query.filter(SCRAPE_RUN_MODEL.id == run_id).update(
+        {
+            SCRAPE_RUN_MODEL.scheduled_pages: func.array_cat(
+                SCRAPE_RUN_MODEL.scheduled_pages, literal(list(pages_nums), type_=ARRAY(Integer))
+            )
+        },
+        synchronize_session=False,
+    )
+    db.session.commit()
+
+
+def get_run(run_id: int) -> ScrapeRun:
+    """Returns run by its id"""
+    return SCRAPE_RUN_MODEL.query.get(run_id)
+
+
+def complete_page(run_id: int, page_num: int = None, failed_offers: list = (), page_result: dict = None) -> None:
+    """Atomically marks run page as completed (if page is given), appends its failed offers to the retry list and its
+    result to the run page results"""
+    values = {}
+    if page_num is not None:
+        values[SCRAPE_RUN_MODEL.completed_pages] = func.array_append(SCRAPE_RUN_MODEL.completed_pages, page_num)
+    if page_result is not None:
+        values[SCRAPE_RUN_MODEL.page_results] = SCRAPE_RUN_MODEL.page_results.op("||")(
+            literal([page_result], type_=JSONB)
+        )
+    if failed_offers:
+        values[SCRAPE_RUN_MODEL.failed_offers] = SCRAPE_RUN_MODEL.failed_offers.op("||")(
+            literal(list(failed_offers), type_=JSONB)
+        )
+    if values:
+        SCRAPE_RUN_MODEL.query.filter(SCRAPE_RUN_MODEL.id == run_id).update(values, synchronize_session=False)
+        db.session.commit()
+
+
+def finish_run(run_id: int) -> None:
+    """Marks run as finished so the next run of its search starts from the first page"""
+    SCRAPE_RUN_MODEL.query.filter(SCRAPE_RUN_MODEL.id == run_id).update(
+        {SCRAPE_RUN_MODEL.finished_at: datetime.now()}, synchronize_session=False
+    )
+    db.session.commit()
+
+
+def finish_discovery(run_id: int) -> bool:
+    """Marks all run pages as scheduled and finishes the run if they are completed already, returns whether it was
+    finished now"""
+    SCRAPE_RUN_MODEL.query.filter(SCRAPE_RUN_MODEL.id == run_id).update(
+        {SCRAPE_RUN_MODEL.discovered_at: datetime.now()}, synchronize_session=False
+    )
+    db.session.commit()
+    return finish_run_if_complete(run_id)
+
+
+def finish_run_if_complete(run_id: int) -> bool:
+    """Marks run as finished once its discovery is finished and all of its scheduled pages are completed, returns
+    whether it was finished now"""
+    finished_count = SCRAPE_RUN_MODEL.query.filter(
+        SCRAPE_RUN_MODEL.id == run_id,
+        SCRAPE_RUN_MODEL.finished_at.is_(None),
+        SCRAPE_RUN_MODEL.discovered_at.isnot(None),
+        SCRAPE_RUN_MODEL.scheduled_pages.contained_by(SCRAPE_RUN_MODEL.completed_pages),
+    ).update({SCRAPE_RUN_MODEL.finished_at: datetime.now()}, synchronize_session=False)
+    db.session.commit()
+    return bool(finished_count)
+
+
+def pop_failed_offers() -> dict:
+    """Takes failed offers out of all runs retry lists, returns them grouped by run id"""
+    runs = (
+        SCRAPE_RUN_MODEL.query.filter(func.jsonb_array_length(SCRAPE_RUN_MODEL.failed_offers) > 0)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    failed_offers = {run.id: run.failed_offers for run in runs}
+    for run in runs:
+        run.failed_offers = []
+    db.session.commit()
+    return failed_offers
@@ -23,21 +23,20 @@ class AverageHousesPricesKeys:
 class AverageHousesPricesPage(BaseHousesPricesPage):
     """House Average Prices Page that privides html layout for house average prices data"""
 
-    data_loader = AverageHousesPricesLoader()
+    DATA_LOADER = AverageHousesPricesLoader
     KEYS = AverageHousesPricesKeys()
 
-    @classmethod
-    def layout(cls, params=None):
+    def layout(self, params=None):
         return html.Div(
             [
-                cls._render_cities_dropdown("row-inputs-container-left"),
-                cls._render_avg_radios("row-inputs-container-right"),
-                cls._render_graph_section("chart-container"),
-                cls._render_area_range_slider("row-inputs-container-range"),
+                self._render_cities_dropdown("row-inputs-container-left"),
+                self._render_avg_radios("row-inputs-container-right"),
+                self._render_graph_section("chart-container"),
+                self._render_area_range_slider("row-inputs-container-range"),
                 html.Div(
                     [
-                        cls._render_price_from_dropdown("chart-dropdown"),
-                        cls._render_price_to_dropdown("chart-dropdown"),
+                        self._render_price_from_dropdown("chart-dropdown"),
+                        self._render_price_to_dropdown("chart-dropdown"),
                     ],
                     className="row-inputs-container",
                 ),
@@ -58,35 +57,37 @@ class AverageHousesPricesPage(BaseHousesPricesPage):
             ],
         )
         def callback_update_figure(city_value, price_from, price_to, area, avg_group_by):
-            cls._update_param(avg_params.CITY, city_value)
-            cls._update_param(avg_params.PRICE_FROM, price_from)
-            cls._update_param(avg_params.PRICE_TO, price_to)
-            areas = cls._get_areas_options()
-            cls._update_param(avg_params.AREA, [areas[area[0]], areas[area[1]]])
-            cls._update_param(avg_params.AVG_GROUP_BY, avg_group_by)
-            return cls._get_graph()
+            page = cls()
+            areas = page._get_areas_options()
+            page.apply_params(
+                {
+                    avg_params.CITY: city_value,
+                    avg_params.PRICE_FROM: price_from,
+                    avg_params.PRICE_TO: price_to,
+                    avg_params.AREA: [areas[area[0]], areas[area[1]]],
+                    avg_params.AVG_GROUP_BY: avg_group_by,
+                }
+            )
+            return page._get_graph()
 
-    @classmethod
-    def _render_avg_radios(cls, class_name):
+    def _render_avg_radios(self, class_name):
         options = [avg_params.DAY, avg_params.WEEK, avg_params.MONTH, avg_params.YEAR]
         avg_group_options = [{"label": f"by {val}", "value": val} for val in options]
         return dcc.RadioItems(
-            id=cls.KEYS.GROUP_AVG_RADIO,
+            id=self.KEYS.GROUP_AVG_RADIO,
             options=avg_group_options,
             value=options[0],
             className=class_name,
         )
 
-    @classmethod
-    def _get_graph(cls):
+    def _get_graph(self):
         data = {
-            "Primary market": cls.dataframe.get("primary_market_data"),
-            "Aftermarket": cls.dataframe.get("aftermarket_data"),
+            "Primary market": self.dataframe.get("primary_market_data"),
+            "Aftermarket": self.dataframe.get("aftermarket_data"),
         }
-        return cls._make_scatter(data, "<b>Average houses prices in selected cities</b>")
+        return self._make_scatter(data, "<b>Average houses prices in selected cities</b>")
 
-    @classmethod
-    def _make_scatter(cls, data, title):
+    def _make_scatter(self, data, title):
         color = {"Aftermarket": "pink", "Primary market": "deeppink"}
         fill = {"Aftermarket": "rgba(100, 26, 161, 0.6)", "Primary market": "rgba(100, 26, 161, 1)"}
         fig = go.Figure()
@@ -9,18 +9,17 @@ class BaseHousesPricesPage(BasePage):
 
     KEYS = None
 
-    @classmethod
-    def layout(cls, params=None) -> html:
+    def layout(self, params=None) -> html:
         return html.Div(
             [
-                cls._render_cities_dropdown("row-inputs-container-left"),
-                cls._render_graph_section("chart-container"),
-                cls._render_area_range_slider("row-inputs-container-range"),
+                self._render_cities_dropdown("row-inputs-container-left"),
+                self._render_graph_section("chart-container"),
+                self._render_area_range_slider("row-inputs-container-range"),
                 html.Div(
                     [
-                        cls._render_date_picker_range("chart-datepicker"),
-                        cls._render_price_from_dropdown("chart-dropdown"),
-                        cls._render_price_to_dropdown("chart-dropdown"),
+                        self._render_date_picker_range("chart-datepicker"),
+                        self._render_price_from_dropdown("chart-dropdown"),
+                        self._render_price_to_dropdown("chart-dropdown"),
                     ],
                     className="row-inputs-container",
                 ),
@@ -28,25 +27,23 @@ class BaseHousesPricesPage(BasePage):
             className="page-container",
         )
 
-    @classmethod
-    def _render_cities_dropdown(cls, class_name):
-        cities = cls._get_cities_options()
-        city_value = cls._get_option_by_name(cities, "Poznań").get("value")
+    def _render_cities_dropdown(self, class_name):
+        cities = self._get_cities_options()
+        city_value = self._get_option_by_name(cities, "Poznań").get("value")
         return html.Div(
             dcc.Dropdown(
-                id=cls.KEYS.CITY_DROPDOWN, options=cities, value=[city_value], multi=True, className="chart-dropdown"
+                id=self.KEYS.CITY_DROPDOWN, options=cities, value=[city_value], multi=True, className="chart-dropdown"
             ),
             className=class_name,
         )
 
-    @classmethod
-    def _render_graph_section(cls, class_name):
+    def _render_graph_section(self, class_name):
         return html.Div(
             [
-                dcc.Graph(id=cls.KEYS.GRAPH, figure=cls._get_graph(), className="chart-chart"),
+                dcc.Graph(id=self.KEYS.GRAPH, figure=self._get_graph(), className="chart-chart"),
                 html.Div(
                     [
-                        cls._render_offer_detail()
+                        self._render_offer_detail()
                     ],
                     className="offer-textholder",
                 ),
@@ -54,9 +51,8 @@ class BaseHousesPricesPage(BasePage):
             className=class_name,
         )
 
-    @classmethod
-    def _render_offer_detail(cls):
-        return html.A("", target="_blank", id=cls.KEYS.OFFER_LINK, className="offer-hyperlink", href="")
+    def _render_offer_detail(self):
+        return html.A("", target="_blank", id=self.KEYS.OFFER_LINK, className="offer-hyperlink", href="")
 
 
     # @classmethod
@@ -66,16 +62,15 @@ class BaseHousesPricesPage(BasePage):
     #     return html.Div(id=cls.KEYS.OFFER_LINK)
 
 
-    @classmethod
-    def _render_area_range_slider(cls, class_name):
-        areas = cls._get_areas_options()
+    def _render_area_range_slider(self, class_name):
+        areas = self._get_areas_options()
         min_area = min([area for area in areas.keys()])
         max_area = max([area for area in areas.keys()])
         return html.Div(
             [
                 html.Label("Area size m²", className="slider-label"),
                 dcc.RangeSlider(
-                    id=cls.KEYS.AREA_SLIDER,
+                    id=self.KEYS.AREA_SLIDER,
                     marks=areas,
                     min=min_area,
                     max=max_area,
@@ -87,33 +82,29 @@ class BaseHousesPricesPage(BasePage):
             className=class_name,
         )
 
-    @classmethod
-    def _render_date_picker_range(cls, class_name):
+    def _render_date_picker_range(self, class_name):
         return html.Div(
-            dcc.DatePickerRange(id=cls.KEYS.DATE_PICKER, **cls._get_date_picker_data(), className=class_name),
+            dcc.DatePickerRange(id=self.KEYS.DATE_PICKER, **self._get_date_picker_data(), className=class_name),
         )
 
-    @classmethod
-    def _render_price_from_dropdown(cls, class_name):
-        prices_from = cls._get_prices_options(greater_than=True)
+    def _render_price_from_dropdown(self, class_name):
+        prices_from = self._get_prices_options(greater_than=True)
         return html.Div(
             dcc.Dropdown(
-                id=cls.KEYS.PRICE_FROM, options=prices_from, value=prices_from[0].get("value"), className=class_name
+                id=self.KEYS.PRICE_FROM, options=prices_from, value=prices_from[0].get("value"), className=class_name
             ),
         )
 
-    @classmethod
-    def _render_price_to_dropdown(cls, class_name):
-        prices_to = cls._get_prices_options(greater_than=False)
+    def _render_price_to_dropdown(self, class_name):
+        prices_to = self._get_prices_options(greater_than=False)
         return html.Div(
             dcc.Dropdown(
-                id=cls.KEYS.PRICE_TO, options=prices_to, value=prices_to[-1].get("value"), className=class_name
+                id=self.KEYS.PRICE_TO, options=prices_to, value=prices_to[-1].get("value"), className=class_name
             ),
         )
 
-    @classmethod
-    def _get_date_picker_data(cls):
-        meta = cls.data_loader.get_metadata()
+    def _get_date_picker_data(self):
+        meta = self.data_loader.get_metadata()
         return {
             "min_date_allowed": meta.get("min_date"),
             "max_date_allowed": meta.get("max_date"),
@@ -121,34 +112,28 @@ class BaseHousesPricesPage(BasePage):
             "end_date": meta.get("max_date"),
         }
 
-    @classmethod
-    def _get_dict_format(cls, objects):
+    def _get_dict_format(self, objects):
         return [{"label": x, "value": x} for x in objects]
 
-    @classmethod
-    def _get_price_dict_format(cls, objects, sign="<"):
+    def _get_price_dict_format(self, objects, sign="<"):
         return [{"label": f"{sign} {x} zł", "value": x} for x in objects]
 
-    @classmethod
-    def _get_cities_options(cls):
-        cities = cls.data_loader.get_metadata().get("available_cities")
-        return cls._get_dict_format(cities)
+    def _get_cities_options(self):
+        cities = self.data_loader.get_metadata().get("available_cities")
+        return self._get_dict_format(cities)
 
-    @classmethod
-    def _get_prices_options(cls, greater_than=True):
+    def _get_prices_options(self, greater_than=True):
         prices = list(range(0, 1100000, 100000))
         sign = ">" if greater_than else "<"
-        return cls._get_price_dict_format(prices, sign)
+        return self._get_price_dict_format(prices, sign)
 
-    @classmethod
-    def _get_areas_options(cls):
-        areas = cls.data_loader.get_metadata().get("areas")
+    def _get_areas_options(self):
+        areas = self.data_loader.get_metadata().get("areas")
         areas = [area for area in areas if area]
         small_areas = list(range(int(min(areas)), 100, 10))
         large_areas = list(range(100, int(max(areas)), 1000))
         all_areas = small_areas + large_areas
         return {i: str(all_areas[i]) for i in range(0, len(all_areas) - 1)}
 
-    @classmethod
-    def _get_option_by_name(cls, options, name):
+    def _get_option_by_name(self, options, name):
         return list(filter(lambda opt: opt["label"] == name, options))[0]
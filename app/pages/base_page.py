@@ -2,27 +2,29 @@ from abc import ABC, abstractmethod
 
 
 class BasePage(ABC):
-    """Abstract Page class that renders html for data from data loader and register callbacks"""
+    """Abstract Page class that renders html for data from data loader and register callbacks, page instance keeps
+    the state of a single request"""
 
-    data_loader = None
-    dataframe = None
-    params = {}
+    DATA_LOADER = None
 
-    @classmethod
-    def load_data(cls):
-        cls.dataframe = cls.data_loader.load_data(cls.params)
+    def __init__(self) -> None:
+        self.data_loader = self.DATA_LOADER()
+        self.dataframe = None
+        self.params = {}
+
+    def load_data(self):
+        self.dataframe = self.data_loader.load_data(self.params)
+
+    def apply_params(self, params: dict):
+        """Replaces all filtering params at once and loads the data for them once"""
+        self.params = dict(params)
+        self.load_data()
 
-    @classmethod
     @abstractmethod
-    def layout(cls, params):
+    def layout(self, params):
         pass
 
     @classmethod
     @abstractmethod
     def register_callbacks(cls, app):
         pass
-
-    @classmethod
-    def _update_param(cls, name, value):
-        cls.params[name] = value
-        cls.load_data()
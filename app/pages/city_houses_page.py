@@ -19,7 +19,7 @@ class CityHousesKeys:
 
 
 class CityHousesPage(BaseHousesPricesPage):
-    data_loader = CityHousesLoader()
+    DATA_LOADER = CityHousesLoader
     KEYS = CityHousesKeys()
 
     @classmethod
@@ -36,27 +36,30 @@ class CityHousesPage(BaseHousesPricesPage):
             ],
         )
         def callback_update_figure(start_date, end_date, city_value, price_from, price_to, area):
-            cls._update_param(house_params.START_DATE, start_date)
-            cls._update_param(house_params.END_DATE, end_date)
-            cls._update_param(house_params.CITY, city_value)
-            cls._update_param(house_params.PRICE_FROM, price_from)
-            cls._update_param(house_params.PRICE_TO, price_to)
-            areas = cls._get_areas_options()
-            cls._update_param(house_params.AREA, [areas[area[0]], areas[area[1]]])
-            return cls._get_graph()
+            page = cls()
+            areas = page._get_areas_options()
+            page.apply_params(
+                {
+                    house_params.START_DATE: start_date,
+                    house_params.END_DATE: end_date,
+                    house_params.CITY: city_value,
+                    house_params.PRICE_FROM: price_from,
+                    house_params.PRICE_TO: price_to,
+                    house_params.AREA: [areas[area[0]], areas[area[1]]],
+                }
+            )
+            return page._get_graph()
 
         @app.callback(Output(cls.KEYS.OFFER_LINK, "href"), Input(cls.KEYS.GRAPH, "clickData"))
         def display_click_data(clickData):
             if clickData:
                 return clickData["points"][0].get("text")
 
-    @classmethod
-    def _get_graph(cls):
-        data = cls.dataframe.get("plain")
-        return cls._make_bar(data, "<b>City house offers with their prices</b>")
+    def _get_graph(self):
+        data = self.dataframe.get("plain")
+        return self._make_bar(data, "<b>City house offers with their prices</b>")
 
-    @classmethod
-    def _make_bar(cls, data, title):
+    def _make_bar(self, data, title):
         color = {"Aftermarket": "pink", "Primary market": "deeppink"}
         data["index"] = list(range(len(data)))
         fig = go.Figure()
@@ -27,29 +27,32 @@ class CombinedPricesAveragesPricesKeys:
 class CombinedPricesAveragesPage(BaseHousesPricesPage):
     """Page that combines house offers prices and average prices and privides html layout for it"""
 
-    data_loader = CityHousesLoader()
-    avg_data_loader = AverageHousesPricesLoader()
+    DATA_LOADER = CityHousesLoader
+    AVG_DATA_LOADER = AverageHousesPricesLoader
     KEYS = CombinedPricesAveragesPricesKeys()
-    avg_params = {}
 
-    @classmethod
-    def load_data(cls):
-        cls.dataframe = cls.data_loader.load_data(cls.params)
-        cls.avg_dataframe = cls.avg_data_loader.load_data(cls.avg_params)
+    def __init__(self) -> None:
+        super().__init__()
+        self.avg_data_loader = self.AVG_DATA_LOADER()
+        self.avg_dataframe = None
+        self.avg_params = {}
 
-    @classmethod
-    def layout(cls, params=None):
+    def load_data(self):
+        self.dataframe = self.data_loader.load_data(self.params)
+        self.avg_dataframe = self.avg_data_loader.load_data(self.avg_params)
+
+    def layout(self, params=None):
         return html.Div(
             [
-                cls._render_cities_dropdown("row-inputs-container-left"),
-                cls._render_avg_radios("row-inputs-container-right"),
-                cls._render_graph_section("chart-container"),
-                cls._render_area_range_slider("row-inputs-container-range"),
+                self._render_cities_dropdown("row-inputs-container-left"),
+                self._render_avg_radios("row-inputs-container-right"),
+                self._render_graph_section("chart-container"),
+                self._render_area_range_slider("row-inputs-container-range"),
                 html.Div(
                     [
-                        cls._render_date_picker_range("chart-datepicker"),
-                        cls._render_price_from_dropdown("chart-dropdown"),
-                        cls._render_price_to_dropdown("chart-dropdown"),
+                        self._render_date_picker_range("chart-datepicker"),
+                        self._render_price_from_dropdown("chart-dropdown"),
+                        self._render_price_to_dropdown("chart-dropdown"),
                     ],
                     className="row-inputs-container",
                 ),
@@ -72,53 +75,52 @@ class CombinedPricesAveragesPage(BaseHousesPricesPage):
             ],
         )
         def callback_update_figure(start_date, end_date, city_value, price_from, price_to, area, avg_group_by):
-            cls._update_param(avg_params.START_DATE, start_date)
-            cls._update_param(avg_params.END_DATE, end_date)
-            cls._update_param(avg_params.CITY, city_value)
-            cls._update_param(avg_params.PRICE_FROM, price_from)
-            cls._update_param(avg_params.PRICE_TO, price_to)
-            areas = cls._get_areas_options()
-            cls._update_param(avg_params.AREA, [areas[area[0]], areas[area[1]]])
-            cls._update_avg_param(avg_params.AVG_GROUP_BY, avg_group_by)
-            return cls._get_graph()
+            page = cls()
+            areas = page._get_areas_options()
+            page.apply_params(
+                {
+                    avg_params.START_DATE: start_date,
+                    avg_params.END_DATE: end_date,
+                    avg_params.CITY: city_value,
+                    avg_params.PRICE_FROM: price_from,
+                    avg_params.PRICE_TO: price_to,
+                    avg_params.AREA: [areas[area[0]], areas[area[1]]],
+                },
+                {avg_params.AVG_GROUP_BY: avg_group_by},
+            )
+            return page._get_graph()
 
         @app.callback(Output(cls.KEYS.OFFER_LINK, "href"), Input(cls.KEYS.GRAPH, "clickData"))
         def display_click_data(clickData):
             if clickData:
                 return clickData["points"][0].get("text")
 
-    @classmethod
-    def _update_param(cls, name, value):
-        cls.params[name] = value
-        cls.avg_params[name] = value
-        cls.load_data()
+    def apply_params(self, params: dict, avg_only_params: dict = None):
+        """Replaces all filtering params of both loaders at once (the average loader gets also its own params) and
+        loads the data for them once"""
+        self.params = dict(params)
+        self.avg_params = {**params, **(avg_only_params or {})}
+        self.load_data()
 
-    @classmethod
-    def _update_avg_param(cls, name, value):
-        cls.avg_params[name] = value
-        cls.load_data()
-
-    @classmethod
-    def _render_avg_radios(cls, class_name):
+    def _render_avg_radios(self, class_name):
         options = [avg_params.DAY, avg_params.WEEK, avg_params.MONTH, avg_params.YEAR]
         avg_group_options = [{"label": f"by {val}", "value": val} for val in options]
         return dcc.RadioItems(
-            id=cls.KEYS.GROUP_AVG_RADIO,
+            id=self.KEYS.GROUP_AVG_RADIO,
             options=avg_group_options,
             value=options[0],
             className=class_name,
         )
 
-    @classmethod
-    def _get_graph(cls):
+    def _get_graph(self):
         title = "<b>House offers prices and average prices in selected cities</b>"
         data = {
-            "Primary market": cls.avg_dataframe.get("primary_market_data"),
-            "Aftermarket": cls.avg_dataframe.get("aftermarket_data"),
+            "Primary market": self.avg_dataframe.get("primary_market_data"),
+            "Aftermarket": self.avg_dataframe.get("aftermarket_data"),
         }
-        bar_data = cls.dataframe.get("plain")
-        traces0 = cls._make_bar(bar_data)
-        traces1 = cls._make_scatter(data)
+        bar_data = self.dataframe.get("plain")
+        traces0 = self._make_bar(bar_data)
+        traces1 = self._make_scatter(data)
         fig = go.Figure(data=[*traces0, *traces1])
         full_price = set()
         fig.for_each_trace(
@@ -158,8 +160,7 @@ class CombinedPricesAveragesPage(BaseHousesPricesPage):
         )
         return fig
 
-    @classmethod
-    def _make_scatter(cls, data):
+    def _make_scatter(self, data):
         line_color = {"Aftermarket": "white", "Primary market": "white"}
         color = {"Aftermarket": "pink", "Primary market": "deeppink"}
 
@@ -193,8 +194,7 @@ class CombinedPricesAveragesPage(BaseHousesPricesPage):
 
         return traces
 
-    @classmethod
-    def _make_bar(cls, data):
+    def _make_bar(self, data):
         color = {"Aftermarket": "pink", "Primary market": "deeppink"}
         traces = []
         data["index"] = list(range(len(data)))
@@ -1 +1,2 @@
+from .date_resolver import DateResolver
 from .olx_content_parser import OLXContentParser
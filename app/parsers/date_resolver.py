@@ -0,0 +1,39 @@
+from datetime import date, datetime, time, timedelta
+
+
+class DateResolver:
+    """Resolves OLX date texts against a reference time captured once, using precomputed day tokens lookup"""
+
+    TODAY = "dzisiaj"  # related to the specifics of the used webpages
+    YESTERDAY = "wczoraj"
+    MONTHS = ["sty", "lut", "mar", "kwi", "maj", "cze", "lip", "sie", "wrz", "paź", "lis", "gru"]
+    LOOKBACK_DAYS = 366
+
+    def __init__(self, reference_time: datetime = None) -> None:
+        self.reference_time = reference_time or datetime.now()
+        today = self.reference_time.date()
+        self._days = {self.TODAY: today, self.YESTERDAY: today - timedelta(days=1)}
+        for days_back in range(self.LOOKBACK_DAYS):  # latest past date wins, so december offers scraped in january
+            day = today - timedelta(days=days_back)  # resolve to the previous year
+            self._days.setdefault(self._get_day_token(day), day)
+            self._days.setdefault(self._get_day_token(day, zero_padded=True), day)
+        self._resolved = {}
+
+    def resolve(self, date_text: str) -> datetime:
+        """Takes in date text ("dzisiaj 12:30", "wczoraj 08:15" or "12 lut") and returns its datetime"""
+        try:
+            return self._resolved[date_text]
+        except KeyError:
+            resolved = self._resolved[date_text] = self._resolve_text(date_text)
+            return resolved
+
+    def _resolve_text(self, date_text: str) -> datetime:
+        """Looks up relative day with its time, or day with month (without time information)"""
+        if date_text[:-6] in (self.TODAY, self.YESTERDAY):
+            hour, minute = date_text[-5:].split(":")
+            return datetime.combine(self._days[date_text[:-6]], time(int(hour), int(minute)))
+        return datetime.combine(self._days[date_text.strip()], time())
+
+    def _get_day_token(self, day: date, zero_padded: bool = False) -> str:
+        day_number = f"{day.day:02d}" if zero_padded else str(day.day)
+        return f"{day_number} {self.MONTHS[day.month - 1]}"
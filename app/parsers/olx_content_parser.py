@@ -1,34 +1,149 @@
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Iterable, Iterator
 
+import numpy as np
+import pandas as pd
 from babel.numbers import parse_decimal
 
+from .date_resolver import DateResolver
+
+NON_LETTERS = re.compile("[^a-zA-Z]+")
+NON_DIGITS = re.compile(r"\D+")
+NON_PRICE_CHARS = re.compile(r"[^\d\s.]")
+WHITESPACE = re.compile(r"\s+")
+AFTERMARKET_PATTERN = re.compile(r"^w.*y$")
+
 
 class OLXContentParser:
     """Parses the data to declared format"""
 
-    TODAY = "dzisiaj"  # related to the specifics of the used webpages
-    YESTERDAY = "wczoraj"
     AFTERMARKER = "Aftermarket"
     PRIMARY_MARKET = "Primary market"
-
-    def __init__(self, olx_data: list) -> None:
+    OFFER_COLUMNS = [
+        "price_text",
+        "datetime_text",
+        "location_text",
+        "area_text",
+        "rooms_count_text",
+        "website",
+        "name",
+        "building_type",
+        "market",
+    ]
+    HOUSE_COLUMNS = [
+        "price",
+        "datetime",
+        "location_city",
+        "location_region",
+        "area",
+        "rooms_count",
+        "website",
+        "name",
+        "building_type",
+        "market",
+    ]
+
+    def __init__(self, olx_data: Iterable, reference_time: datetime = None) -> None:
         self._offers_list = olx_data
+        self._date_resolver = DateResolver(reference_time)
 
     def parse(self) -> list:
         """Parses all offers from the offer list in a loop"""
-        return [self._parse_single_offer(data) for data in self._offers_list]
+        return list(self.parse_iter())
+
+    def parse_iter(self) -> Iterator[dict]:
+        """Lazily parses offers one by one as they come from the offer iterable"""
+        return (self._parse_single_offer(data) for data in self._offers_list)
+
+    def parse_with_failures(self) -> tuple:
+        """Parses offers one by one, returns parsed offers and the raw offers that could not be parsed"""
+        parsed_offers, failed_offers = [], []
+        for data in self._offers_list:
+            try:
+                parsed_offers.append(self._parse_single_offer(dict(data)))
+            except Exception as error:  # one malformed offer must not fail the whole list
+                print(f"Failed to parse offer {data.get('website')}: {error!r}")
+                failed_offers.append(data)
+        return parsed_offers, failed_offers
+
+    def parse_batch(self) -> list:
+        """Parses all offers at once as columns and returns them as dicts"""
+        houses = self.parse_frame()
+        return houses.astype(object).where(houses.notnull(), None).to_dict("records")
+
+    def parse_frame(self) -> pd.DataFrame:
+        """Parses all offers at once as columns, drops offers whose price or datetime cannot be parsed"""
+        offers = pd.DataFrame.from_records(
+            [self._offer_to_text(dict(offer)) for offer in self._offers_list], columns=self.OFFER_COLUMNS
+        ).astype(object)
+        if offers.empty:
+            return pd.DataFrame(columns=self.HOUSE_COLUMNS)
+
+        location = offers["location_text"].str.split(",", expand=True)
+        houses = pd.DataFrame(
+            {
+                "price": self._parse_prices(offers["price_text"]),
+                "datetime": self._map_unique(offers["datetime_text"], self._parse_datetime),
+                "location_city": location[0],
+                "location_region": location[1] if 1 in location else None,
+                "area": self._parse_digits(offers["area_text"]),
+                "rooms_count": self._parse_digits(offers["rooms_count_text"]).astype("Int64"),
+                "website": offers["website"],
+                "name": offers["name"],
+                "building_type": offers["building_type"].str.replace(NON_LETTERS, "", regex=True),
+                "market": self._parse_market_types(offers["market"]),
+            }
+        )
+        parsed = houses["price"].notnull() & houses["datetime"].notnull()
+        if not parsed.all():
+            print(f"Dropped {(~parsed).sum()} offers with price or datetime that could not be parsed")
+        return houses[parsed]
+
+    def _parse_prices(self, prices_texts: pd.Series) -> pd.Series:
+        """Converts price texts column to floats, texts with other characters than the price ones (like "do negocjacji")
+        cannot be parsed, as in row by row parsing"""
+        prices_texts = prices_texts.str.replace("zł", "", regex=False).str.replace(",", ".", regex=False)
+        prices_texts = prices_texts.mask(prices_texts.str.contains(NON_PRICE_CHARS, na=True))
+        return pd.to_numeric(prices_texts.str.replace(WHITESPACE, "", regex=True), errors="coerce")
+
+    def _parse_digits(self, texts: pd.Series) -> pd.Series:
+        """Converts texts column to numbers made of their digits"""
+        digits = texts.str.replace(NON_DIGITS, "", regex=True).replace("", np.nan)
+        return pd.to_numeric(digits, errors="coerce")
+
+    def _parse_market_types(self, markets_texts: pd.Series) -> pd.Series:
+        """Checks which market type represents every item of the column"""
+        letters = markets_texts.str.replace(NON_LETTERS, "", regex=True).str.lower()
+        is_aftermarket = letters.str.contains(AFTERMARKET_PATTERN, na=False).astype(bool)
+        market_types = pd.Series(np.where(is_aftermarket, self.AFTERMARKER, self.PRIMARY_MARKET), index=letters.index)
+        return market_types.mask(markets_texts.fillna("") == "")
+
+    def _map_unique(self, texts: pd.Series, parse_func) -> pd.Series:
+        """Parses every distinct value of the column once, values that cannot be parsed become None"""
+        parsed_values = {}
+        for text in texts.dropna().unique():
+            try:
+                parsed_values[text] = parse_func(text)
+            except (KeyError, TypeError, ValueError):
+                parsed_values[text] = None
+        return texts.map(parsed_values)
+
+    @staticmethod
+    def _offer_to_text(offer: dict) -> dict:
+        """Takes in a offer dict and changes items values to text format"""
+        for k, v in offer.items():
+            try:
+                offer[k] = v.get_text().strip()
+            except AttributeError:
+                pass
+        return offer
 
     def _params_to_text_decorator(func):
         """Takes in a offer dict and changes items values to text format"""
 
         def wrapper(self, offer: dict) -> dict:
-            for k, v in offer.items():
-                try:
-                    offer[k] = v.get_text().strip()
-                except AttributeError:
-                    pass
-            return func(self, offer=offer)
+            return func(self, offer=self._offer_to_text(offer))
 
         return wrapper
 
@@ -44,16 +159,22 @@ class OLXContentParser:
             "rooms_count": self._parse_text_to_int(offer.get("rooms_count_text")),
             "website": offer.get("website"),
             "name": offer.get("name"),
-            "building_type": re.sub("[^a-zA-Z]+", "", offer.get("building_type", "")),
-            "market": self._parse_market_type(offer.get("market", "")),
+            "building_type": self._parse_building_type(offer.get("building_type")),
+            "market": self._parse_market_type(offer.get("market")),
         }
 
+    def _parse_building_type(self, building_text: str) -> str:
+        """Leaves only letters of building type, returns None if detail data was not scraped"""
+        if building_text is None:
+            return None
+        return NON_LETTERS.sub("", building_text)
+
     def _parse_market_type(self, market_text: str) -> str:
         """Checks which market type represents selected item"""
         if not market_text:
             return None
-        text = re.sub("[^a-zA-Z]+", "", market_text)
-        if re.search(r"^w.*y$", text.lower()):
+        text = NON_LETTERS.sub("", market_text)
+        if AFTERMARKET_PATTERN.search(text.lower()):
             return self.AFTERMARKER
         else:
             return self.PRIMARY_MARKET
@@ -77,41 +198,5 @@ class OLXContentParser:
         return int("".join(filter(str.isdigit, text))) if text else None
 
     def _parse_datetime(self, date_data: str) -> datetime:
-        """Takes in date as string and searches for patterns that allows to parse it to a datetime"""
-        date_core = date_data[:-6]
-        day = {
-            self.TODAY: datetime.now(),
-            self.YESTERDAY: datetime.now() - timedelta(days=1),
-        }.get(date_core)
-        if day is not None:
-            day = self._restore_time(day, date_data)  # restore lost time information
-        else:
-            day = self._get_datetime_by_month_text(date_data)
-        return day
-
-    def _restore_time(self, day: str, time_data: datetime) -> datetime:
-        """Takes in day data and its original time-string and converts it to a datetime"""
-        time = time_data[-5:]
-        time = datetime.strptime(time, "%H:%M")
-        return day.replace(hour=time.hour, minute=time.minute)
-
-    def _get_datetime_by_month_text(self, month_text: str) -> datetime:
-        """Takes month text in polish and searches for english substitute to convert it into a datetime"""
-        month_string = {
-            "sty": "january",
-            "lut": "february",
-            "mar": "march",
-            "kwie": "april",
-            "maj": "may",
-            "cze": "june",
-            "lip": "july",
-            "sie": "august",
-            "wrz": "september",
-            "paź": "october",
-            "lis": "november",
-            "gru": "december",
-        }.get(month_text[-3:])
-        year = datetime.now().year
-        day = month_text[:-4]
-        date_string = f"{day} {month_string} {year}"
-        return datetime.strptime(date_string, "%d %B %Y")
+        """Takes in date as string and resolves it against the parser reference time"""
+        return self._date_resolver.resolve(date_data)
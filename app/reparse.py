@@ -0,0 +1,49 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import chain
+
+from config import DBConfig
+from db.house_tools import add_new_houses_in_chunks, bulk_ingest_houses
+from parsers import OLXContentParser
+from scrappers import HouseDataScraper, HouseDetailScraper
+from scrappers.page_archive import PageArchive
+
+_archive = None
+_detail_digests = None
+
+
+def _init_worker(archive_dir: str, detail_digests: dict) -> None:
+    """Sets up archive access in the reparsing worker process"""
+    global _archive, _detail_digests
+    _archive = PageArchive(archive_dir)
+    _detail_digests = detail_digests
+
+
+def _reparse_listing(entry: dict) -> list:
+    """Re-runs listing extraction, detail strategies and parser over single archived listing page"""
+    offers = HouseDataScraper(entry["url"]).extract_offers(_archive.load(entry["digest"]))
+    detail_scraper = HouseDetailScraper()
+    for offer in offers:
+        detail_digest = _detail_digests.get(offer["website"])
+        if detail_digest:
+            offer.update(detail_scraper.extract_detail_house_data(offer["website"], _archive.load(detail_digest)))
+    return OLXContentParser(offers, reference_time=entry["fetched_at"]).parse_batch()
+
+
+def reparse_archive(
+    archive_dir: str, since: datetime = None, until: datetime = None, workers: int = None, bulk: bool = False
+) -> dict:
+    """Reparses archived listing pages fetched between given datetimes in parallel and upserts corrected houses
+    (with COPY bulk ingest in bulk mode)"""
+    archive = PageArchive(archive_dir)
+    detail_digests = {
+        entry["url"]: entry["digest"] for entry in archive.iter_entries() if entry["kind"] == PageArchive.DETAIL
+    }  # entries are ordered by fetch time, so the latest detail page of every offer is kept
+    listing_entries = [entry for entry in archive.iter_entries(since, until) if entry["kind"] == PageArchive.LISTING]
+    print(f"Reparsing {len(listing_entries)} listing pages with {len(detail_digests)} archived detail pages...")
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(archive_dir, detail_digests)) as executor:
+        houses = chain.from_iterable(executor.map(_reparse_listing, listing_entries))
+        if bulk:
+            return bulk_ingest_houses(houses)
+        return add_new_houses_in_chunks(houses, DBConfig.UPSERT_CHUNK_SIZE)
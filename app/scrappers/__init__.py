@@ -1 +1,3 @@
 from .house_data_scraper import HouseDataScraper
+from .house_detail_scraper import HouseDetailScraper
+from .http_cache import get_cache
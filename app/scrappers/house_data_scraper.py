@@ -1,30 +1,90 @@
+from typing import Callable, Iterator
+
 import bs4 as bs
-from requests import get
+from config import ScraperConfig
 
 from .house_detail_scraper import HouseDetailScraper
+from .html_parser import parse_html
+from .http_session import get_session
+from .page_archive import PageArchive, archive_page
 
 
 class HouseDataScraper:
     """Extracts data from the HTML of an url."""
 
-    MAX_PAGE = 15
+    STOP_PAGE_LIMIT = "page limit reached"
+    STOP_EMPTY_PAGE = "empty page"
+    STOP_REPEATED_PAGE = "repeated page"
+    STOP_KNOWN_OFFERS = "page with known offers only"
+    PARSE_ONLY = bs.SoupStrainer("div", class_="offer-wrapper")
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, known_offers_lookup: Callable[[list], dict] = None, max_pages: int = None) -> None:
         self._url = url
         self._detail_scraper = HouseDetailScraper()
+        self._known_offers_lookup = known_offers_lookup
+        self._max_pages = max_pages or ScraperConfig.MAX_PAGES
+        self.pages_scanned = 0
+        self.stop_reason = None
 
     def scrap(self) -> list:
-        """Scraps page data using pagination"""
-        offers = []
-        for page_num in range(1, self.MAX_PAGE):
+        """Scraps page data using pagination and returns all offers at once"""
+        return [offer for page_offers in self.scrap_pages() for offer in page_offers]
+
+    def scrap_pages(self) -> Iterator[list]:
+        """Scraps page data using pagination and yields offers with their detail data page by page"""
+        for _, page_offers, known_offers in self.discover_pages():
+            offers_data, _ = self._detail_scraper.add_detail_data(page_offers, known_offers)
+            yield offers_data
+
+    def discover_pages(self, first_page: int = 1) -> Iterator[tuple]:
+        """Scans listing pages yielding page number, offers and known offers, stops on empty, repeated or known page"""
+        seen_pages = set()
+        self.pages_scanned, self.stop_reason = 0, self.STOP_PAGE_LIMIT
+        for page_num in range(first_page, self._max_pages + 1):
             print(f"Scraping data from page {page_num}...")
-            page = get(self._url, params={"page": page_num})
-            parsed_page = bs.BeautifulSoup(page.content, "html.parser")
-            offers += parsed_page.find_all("div", class_="offer-wrapper")
-        return [self._get_offer_data(offer) for offer in offers]
+            page_offers = self._get_page_offers(page_num)
+            self.pages_scanned += 1
+            page_websites = tuple(offer["website"] for offer in page_offers)
+            if not page_offers:
+                self.stop_reason = self.STOP_EMPTY_PAGE
+                break
+            if page_websites in seen_pages:
+                self.stop_reason = self.STOP_REPEATED_PAGE
+                break
+            seen_pages.add(page_websites)
+
+            known_offers = self._get_known_offers(page_offers)
+            yield page_num, page_offers, known_offers
+            if all(known_offers.get(website) for website in page_websites):
+                self.stop_reason = self.STOP_KNOWN_OFFERS
+                break
+        print(f"Scanned {self.pages_scanned} pages, stopped: {self.stop_reason}")
+
+    def _get_page_offers(self, page_num: int) -> list:
+        """Downloads single listing page and returns its offers list page data"""
+        page = get_session().get(self._url, params={"page": page_num})
+        archive_page(page.url, page.content, PageArchive.LISTING)
+        return self.extract_offers(page.content)
+
+    def extract_offers(self, content: bytes) -> list:
+        """Takes in a listing page content and returns its offers list page data"""
+        parsed_page = parse_html(content, self.PARSE_ONLY)
+        offers_data = []
+        for offer in parsed_page.find_all("div", class_="offer-wrapper"):
+            try:
+                offers_data.append(self._get_offer_data(offer))
+            except (AttributeError, KeyError, TypeError, ValueError) as error:
+                print(f"Skipping offer with unexpected HTML: {error!r}")
+        return offers_data
+
+    def _get_known_offers(self, offers_data: list) -> dict:
+        """Maps websites of already known offers to whether they are unchanged since they were stored"""
+        if self._known_offers_lookup is None:
+            return {}
+        return self._known_offers_lookup(offers_data)
 
     def _get_offer_data(self, offer: str) -> dict:
-        """Takes in a offer parsed data and searches for needed tags"""
+        """Takes in a offer parsed data, searches for needed list page tags and returns their text"""
         name = offer.find("strong")
         price_text = offer.find("p", class_="price")
         footer = offer.find("td", class_="bottom-cell")
@@ -32,13 +92,11 @@ class HouseDataScraper:
         location_text, date_time_text = footer_data
 
         hyperlink = offer.find("a")["href"]
-        detail_data = self._detail_scraper.scrap_detail_house_data(hyperlink)
 
         return {
-            "name": name,
-            "price_text": price_text,
-            "datetime_text": date_time_text,
-            "location_text": location_text,
+            "name": name.get_text().strip(),
+            "price_text": price_text.get_text().strip(),
+            "datetime_text": date_time_text.get_text().strip(),
+            "location_text": location_text.get_text().strip(),
             "website": hyperlink,
-            **detail_data,
         }
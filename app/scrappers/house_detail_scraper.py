@@ -1,7 +1,15 @@
+import json
 import re
-import bs4 as bs
 from abc import ABC
-from requests import get
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+
+import bs4 as bs
+from config import ScraperConfig
+
+from .html_parser import parse_html
+from .http_cache import get_page_content
+from .page_archive import PageArchive, archive_page
 
 
 class HouseDetailStrategy(ABC):
@@ -12,12 +20,18 @@ class HouseDetailStrategy(ABC):
     ROOMS = "Liczba pokoi"
     BUILDING = "Rodzaj zabudowy"
     MARKET = "Rynek"
+    PARAMS = {AREA: "area", ROOMS: "rooms_count", MARKET: "market", BUILDING: "building_type"}
+    PARSE_ONLY = None
 
     def get_data(self, hyperlink: str) -> dict:
         """Takes in a hyperlink, scraps data, pre-prepares it and returns it as a dict"""
-        offer_page = get(hyperlink)
-        parsed_page = bs.BeautifulSoup(offer_page.content, "html.parser")
-        data = self._scrap_data(parsed_page)
+        content = get_page_content(hyperlink)
+        archive_page(hyperlink, content, PageArchive.DETAIL)
+        return self.extract_data(content)
+
+    def extract_data(self, content: bytes) -> dict:
+        """Takes in an already downloaded offer page content, scraps data and pre-prepares it"""
+        data = self._scrap_page(content)
         return {
             "area_text": self._remove_substring(data["area"], self.AREA),
             "rooms_count_text": self._remove_substring(data["rooms_count"], self.ROOMS),
@@ -25,10 +39,22 @@ class HouseDetailStrategy(ABC):
             "market": self._remove_substring(data["market"], self.MARKET),
         }
 
+    def _scrap_page(self, content: bytes) -> dict:
+        """Parses web page content and scraps its data"""
+        return self._scrap_data(parse_html(content, self.PARSE_ONLY))
+
     def _scrap_data(self, parsed_page: str) -> dict:
         """Concrete function that can scrap web page data"""
         raise NotImplementedError
 
+    def _map_params(self, params: list) -> dict:
+        """Takes in (label, value) pairs of offer parameters and maps values of the needed ones to data keys"""
+        data = dict.fromkeys(self.PARAMS.values(), "")
+        for label, value in params:
+            if label in self.PARAMS:
+                data[self.PARAMS[label]] = value
+        return data
+
     def _remove_substring(self, string: str, substring: str) -> str:
         """Finds substring in a string and removes it"""
         return string.replace(substring, "") if string else ""
@@ -37,29 +63,60 @@ class HouseDetailStrategy(ABC):
 class OlxHouseDetailStrategy(HouseDetailStrategy):
     """Scraper for OLX house offer detail web page"""
 
+    PARAMS_PATTERN = re.compile("|".join(HouseDetailStrategy.PARAMS))
+    PARSE_ONLY = bs.SoupStrainer(["li", "p"])  # offer parameters are list items or paragraphs of the params list
+
     def _scrap_data(self, parsed_page: str) -> dict:
-        return {
-            "area": parsed_page.find(text=re.compile(self.AREA)),
-            "rooms_count": parsed_page.find(text=re.compile(self.ROOMS)),
-            "market": parsed_page.find(text=re.compile(self.MARKET)),
-            "building_type": parsed_page.find(text=re.compile(self.BUILDING)),
-        }
+        data = dict.fromkeys(self.PARAMS.values())
+        for text in parsed_page.find_all(string=True):
+            for label in self.PARAMS_PATTERN.findall(text):
+                if data[self.PARAMS[label]] is None:
+                    data[self.PARAMS[label]] = text
+        return data
 
 
 class OtodomHouseDetailStrategy(HouseDetailStrategy):
     """Scraper for Otodom house offer detail web page"""
 
+    PARSE_ONLY = bs.SoupStrainer("div", attrs={"aria-label": list(HouseDetailStrategy.PARAMS)})
+
     def _scrap_data(self, parsed_page: str) -> dict:
-        area = parsed_page.find("div", {"aria-label": self.AREA})
-        rooms = parsed_page.find("div", {"aria-label": self.ROOMS})
-        market = parsed_page.find("div", {"aria-label": self.MARKET})
-        building = parsed_page.find("div", {"aria-label": self.BUILDING})
-        return {
-            "area": area.get_text() if area else "",
-            "rooms_count": rooms.get_text() if rooms else "",
-            "market": market.get_text() if market else "",
-            "building_type": building.get_text() if building else "",
-        }
+        data = dict.fromkeys(self.PARAMS.values(), "")
+        for param in parsed_page.find_all("div", attrs={"aria-label": list(self.PARAMS)}):
+            key = self.PARAMS[param["aria-label"]]
+            if not data[key]:
+                data[key] = param.get_text()
+        return data
+
+
+class OlxJsonHouseDetailStrategy(OlxHouseDetailStrategy):
+    """Scraper for OLX house offer detail web page that reads the page state JSON, falls back to DOM scraping"""
+
+    STATE_PATTERN = re.compile(rb'window\.__PRERENDERED_STATE__\s*=\s*("(?:[^"\\]|\\.)*")')
+
+    def _scrap_page(self, content: bytes) -> dict:
+        match = self.STATE_PATTERN.search(content)
+        try:
+            state = json.loads(json.loads(match.group(1)))
+            params = state["ad"]["ad"]["params"]
+            return self._map_params((param["name"], param["value"]) for param in params)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return super()._scrap_page(content)
+
+
+class OtodomJsonHouseDetailStrategy(OtodomHouseDetailStrategy):
+    """Scraper for Otodom house offer detail web page that reads the Next.js data JSON, falls back to DOM scraping"""
+
+    STATE_PATTERN = re.compile(rb'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>', re.DOTALL)
+
+    def _scrap_page(self, content: bytes) -> dict:
+        match = self.STATE_PATTERN.search(content)
+        try:
+            state = json.loads(match.group(1))
+            params = state["props"]["pageProps"]["ad"]["characteristics"]
+            return self._map_params((param["label"], param["localizedValue"]) for param in params)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return super()._scrap_page(content)
 
 
 class HouseDetailScraper:
@@ -68,12 +125,51 @@ class HouseDetailScraper:
     OTODOM_URL = "www.otodom.pl"
     OLX_URL = "www.olx.pl"
 
+    def __init__(self) -> None:
+        self._domain_limits = {
+            domain: BoundedSemaphore(limit) for domain, limit in ScraperConfig.DOMAIN_CONCURRENCY.items()
+        }
+
     def scrap_detail_house_data(self, hyperlink: str) -> dict:
         """Takes in a house offer hyperlink, returns scraped data"""
         domain = self._get_domain_from_hyperlink(hyperlink)
         scraping_strategy = self._get_strategy(domain)
         return scraping_strategy.get_data(hyperlink)
 
+    def extract_detail_house_data(self, hyperlink: str, content: bytes) -> dict:
+        """Takes in a house offer hyperlink and its already downloaded page content, returns scraped data"""
+        domain = self._get_domain_from_hyperlink(hyperlink)
+        return self._get_strategy(domain).extract_data(content)
+
+    def add_detail_data(self, offers_data: list, known_offers: dict) -> tuple:
+        """Scraps detail pages of offers not known yet, returns scraped offers and offers whose detail page failed"""
+        new_offers = [offer for offer in offers_data if offer["website"] not in known_offers]
+        details_data = self.scrap_detail_houses_data([offer["website"] for offer in new_offers])
+        failed_offers = []
+        for offer_data, detail_data in zip(new_offers, details_data):
+            if detail_data is None:
+                failed_offers.append(offer_data)
+            else:
+                offer_data.update(detail_data)
+        print(f"Scraped details of {len(new_offers)} new offers, skipped {len(offers_data) - len(new_offers)} known")
+        failed_ids = {id(offer) for offer in failed_offers}
+        return [offer for offer in offers_data if id(offer) not in failed_ids], failed_offers
+
+    def scrap_detail_houses_data(self, hyperlinks: list) -> list:
+        """Takes in house offers hyperlinks, scraps them concurrently and returns data in the same order"""
+        with ThreadPoolExecutor(max_workers=ScraperConfig.MAX_WORKERS) as executor:
+            return list(executor.map(self._scrap_detail_house_data_safely, hyperlinks))
+
+    def _scrap_detail_house_data_safely(self, hyperlink: str) -> dict:
+        """Scraps single offer detail within its domain concurrency limit, returns None on failure"""
+        domain = self._get_domain_from_hyperlink(hyperlink)
+        with self._domain_limits[domain]:
+            try:
+                return self.scrap_detail_house_data(hyperlink)
+            except Exception as error:  # one broken offer page must not fail the whole batch
+                print(f"Failed to scrap offer detail {hyperlink}: {error!r}")
+                return None
+
     def _get_domain_from_hyperlink(self, hyperlink: str) -> str:
         """Takes in a house offer hyperlink and return its domain"""
         return self.OLX_URL if self.OLX_URL in hyperlink else self.OTODOM_URL
@@ -81,6 +177,6 @@ class HouseDetailScraper:
     def _get_strategy(self, domain: str) -> HouseDetailStrategy:
         """Gets a domain and returns appropriate scraping class instance"""
         return {
-            self.OLX_URL: OlxHouseDetailStrategy(),
-            self.OTODOM_URL: OtodomHouseDetailStrategy(),
+            self.OLX_URL: OlxJsonHouseDetailStrategy(),
+            self.OTODOM_URL: OtodomJsonHouseDetailStrategy(),
         }.get(domain)
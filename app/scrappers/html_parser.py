@@ -0,0 +1,12 @@
+import bs4 as bs
+from config import ScraperConfig
+
+FALLBACK_PARSER = "html.parser"
+
+
+def parse_html(content: bytes, parse_only: bs.SoupStrainer = None) -> bs.BeautifulSoup:
+    """Parses page with configured backend, materializing only the nodes accepted by parse_only strainer"""
+    try:
+        return bs.BeautifulSoup(content, ScraperConfig.HTML_PARSER, parse_only=parse_only)
+    except bs.FeatureNotFound:
+        return bs.BeautifulSoup(content, FALLBACK_PARSER, parse_only=parse_only)
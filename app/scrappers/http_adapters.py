@@ -0,0 +1,81 @@
+import random
+from urllib.parse import urlparse
+
+from config import ScraperConfig
+from requests import Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from .page_corpus import PageCorpus
+from .rate_limiter import get_rate_limiter
+
+
+class JitteredRetry(Retry):
+    """Retry policy with exponential backoff and random jitter (Retry-After header still takes precedence)"""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, ScraperConfig.BACKOFF_JITTER) if backoff else backoff
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that applies default timeouts to every request sent through it"""
+
+    def __init__(self, *args, timeout: tuple = None, **kwargs) -> None:
+        self._timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout
+        return super().send(request, **kwargs)
+
+
+class RateLimitedHTTPAdapter(TimeoutHTTPAdapter):
+    """HTTP adapter that waits for the domain rate limit before sending each request"""
+
+    def send(self, request, **kwargs):
+        get_rate_limiter().acquire(urlparse(request.url).netloc)
+        return super().send(request, **kwargs)
+
+
+class RecordingAdapter(RateLimitedHTTPAdapter):
+    """HTTP adapter that sends requests to the web and records every successful response to the corpus"""
+
+    def __init__(self, corpus: PageCorpus, *args, **kwargs) -> None:
+        self._corpus = corpus
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if response.status_code == 200:
+            self._corpus.save(request.url, response.status_code, response.headers, response.content)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """HTTP adapter that serves responses from the corpus without touching the network"""
+
+    def __init__(self, corpus: PageCorpus) -> None:
+        self._corpus = corpus
+        super().__init__()
+
+    def send(self, request, **kwargs):
+        response = Response()
+        response.url = request.url
+        response.request = request
+        recorded = self._corpus.load(request.url)
+        if recorded is None:
+            response.status_code, response._content = 404, b""
+            return response
+
+        status_code, headers, content = recorded
+        headers.pop("Content-Encoding", None)  # recorded content is already decoded
+        response.status_code, response._content = status_code, content
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = "utf-8"
+        return response
+
+    def close(self) -> None:
+        pass
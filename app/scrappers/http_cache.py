@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import time
+from threading import Lock
+
+from config import ScraperConfig
+
+from .http_session import get_session
+
+
+class HttpCache:
+    """Persistent URL keyed response cache that revalidates stale entries with conditional requests"""
+
+    BODY_SUFFIX = ".body"
+    META_SUFFIX = ".json"
+
+    def __init__(self, directory: str, ttl: float, max_size: int) -> None:
+        self._directory = directory
+        self._ttl = ttl
+        self._max_size = max_size
+        self._lock = Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(entry_stat.st_size for _, entry_stat in self._scan_entries())
+        self.stats = self._empty_stats()
+
+    def get(self, url: str) -> bytes:
+        """Returns page content from cache, revalidating it or downloading it when stale or missing"""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        meta = self._load_meta(key)
+        if meta and time.time() - meta["stored_at"] < self._ttl:
+            return self._serve_cached(key, "hits")
+
+        response = get_session().get(url, headers=self._get_conditional_headers(meta))
+        if meta and response.status_code == 304:
+            self._store(key, {**meta, "stored_at": time.time()})
+            return self._serve_cached(key, "not_modified")
+
+        self._count("misses")
+        if response.status_code == 200:
+            meta = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "stored_at": time.time(),
+            }
+            self._store(key, meta, response.content)
+        return response.content
+
+    def pop_stats(self) -> dict:
+        """Returns hit/miss/304 counters collected so far and resets them"""
+        with self._lock:
+            stats, self.stats = self.stats, self._empty_stats()
+        return stats
+
+    def _empty_stats(self) -> dict:
+        return {"hits": 0, "misses": 0, "not_modified": 0, "bytes_saved": 0}
+
+    def _count(self, counter: str, saved_bytes: int = 0) -> None:
+        with self._lock:
+            self.stats[counter] += 1
+            self.stats["bytes_saved"] += saved_bytes
+
+    def _get_conditional_headers(self, meta: dict) -> dict:
+        """Builds validators headers for stored entry"""
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _serve_cached(self, key: str, counter: str) -> bytes:
+        """Reads stored body and marks entry as recently used"""
+        body_path = self._get_path(key, self.BODY_SUFFIX)
+        with open(body_path, "rb") as body_file:
+            content = body_file.read()
+        os.utime(body_path)
+        self._count(counter, len(content))
+        return content
+
+    def _load_meta(self, key: str) -> dict:
+        try:
+            with open(self._get_path(key, self.META_SUFFIX)) as meta_file:
+                meta = json.load(meta_file)
+        except (OSError, ValueError):
+            return None
+        return meta if os.path.exists(self._get_path(key, self.BODY_SUFFIX)) else None
+
+    def _store(self, key: str, meta: dict, content: bytes = None) -> None:
+        """Atomically writes entry files and evicts least recently used entries over the size limit"""
+        if content is not None:
+            self._write(self._get_path(key, self.BODY_SUFFIX), content)
+        self._write(self._get_path(key, self.META_SUFFIX), json.dumps(meta).encode())
+        if self._size > self._max_size:
+            self._evict()
+
+    def _write(self, path: str, content: bytes) -> None:
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        tmp_path = f"{path}.{os.getpid()}.{id(content)}.tmp"
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._size += len(content) - old_size
+
+    def _evict(self) -> None:
+        """Removes least recently used entries until cache fits its size limit"""
+        with self._lock:
+            bodies = self._scan_entries(self.BODY_SUFFIX)  # mtimes are read up front, sorting cannot hit vanished files
+            for body, _ in sorted(bodies, key=lambda body: body[1].st_mtime):
+                if self._size <= self._max_size:
+                    break
+                key = body.name[: -len(self.BODY_SUFFIX)]
+                for path in (self._get_path(key, self.BODY_SUFFIX), self._get_path(key, self.META_SUFFIX)):
+                    try:
+                        self._size -= os.path.getsize(path)
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+    def _scan_entries(self, suffix: str = "") -> list:
+        """Returns (entry, stat) pairs of cache files with given suffix, skipping files that other processes sharing
+        the cache directory have removed meanwhile"""
+        entries = []
+        for entry in os.scandir(self._directory):
+            if not entry.name.endswith(suffix):
+                continue
+            try:
+                if entry.is_file():
+                    entries.append((entry, entry.stat()))
+            except OSError:
+                pass
+        return entries
+
+    def _get_path(self, key: str, suffix: str) -> str:
+        return os.path.join(self._directory, f"{key}{suffix}")
+
+
+_cache = None
+_cache_lock = Lock()
+
+
+def get_cache() -> HttpCache:
+    """Returns process-wide detail pages cache, None when caching is disabled"""
+    global _cache
+    if not ScraperConfig.CACHE_DIR:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache(ScraperConfig.CACHE_DIR, ScraperConfig.CACHE_TTL, ScraperConfig.CACHE_MAX_SIZE)
+        return _cache
+
+
+def get_page_content(url: str) -> bytes:
+    """Returns page content through the cache, or directly from the web when caching is disabled"""
+    cache = get_cache()
+    return cache.get(url) if cache else get_session().get(url).content
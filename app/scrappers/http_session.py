@@ -0,0 +1,68 @@
+from threading import Lock
+
+from config import ScraperConfig
+from requests import Session
+from requests.adapters import BaseAdapter
+
+from .http_adapters import JitteredRetry, RateLimitedHTTPAdapter, RecordingAdapter, ReplayAdapter
+from .page_corpus import PageCorpus
+
+LIVE = "live"
+RECORD = "record"
+REPLAY = "replay"
+
+
+_session = None
+_session_lock = Lock()
+
+
+def make_session() -> Session:
+    """Creates keep-alive session with pooled connections, compression and retries for scraped domains"""
+    adapter = _make_adapter(ScraperConfig.HTTP_MODE)
+    session = Session()
+    session.headers.update({"Accept-Encoding": "gzip, deflate, br", "Connection": "keep-alive"})
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _make_adapter(mode: str) -> BaseAdapter:
+    """Creates adapter that fetches live pages, records them to the corpus or replays them from it"""
+    if mode == REPLAY:
+        return ReplayAdapter(PageCorpus(ScraperConfig.CORPUS_DIR))
+
+    retry = JitteredRetry(
+        total=ScraperConfig.RETRIES,
+        backoff_factor=ScraperConfig.BACKOFF_FACTOR,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter_kwargs = {
+        "pool_connections": len(ScraperConfig.DOMAIN_CONCURRENCY),
+        "pool_maxsize": ScraperConfig.POOL_SIZE,
+        "max_retries": retry,
+        "timeout": (ScraperConfig.CONNECT_TIMEOUT, ScraperConfig.READ_TIMEOUT),
+    }
+    if mode == RECORD:
+        return RecordingAdapter(PageCorpus(ScraperConfig.CORPUS_DIR), **adapter_kwargs)
+    return RateLimitedHTTPAdapter(**adapter_kwargs)
+
+
+def set_http_mode(mode: str, corpus_dir: str = None) -> None:
+    """Switches all scrapers between live, record and replay mode (recreates the shared session)"""
+    global _session
+    with _session_lock:
+        ScraperConfig.HTTP_MODE = mode
+        ScraperConfig.CORPUS_DIR = corpus_dir or ScraperConfig.CORPUS_DIR
+        _session = None
+
+
+def get_session() -> Session:
+    """Returns process-wide session shared by all scrapers"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = make_session()
+        return _session
@@ -0,0 +1,84 @@
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from threading import Lock
+from typing import Iterator
+
+from config import ScraperConfig
+
+from .http_session import REPLAY
+
+
+class PageArchive:
+    """Content-addressed archive of gzip compressed raw pages with an index of their urls and fetch times"""
+
+    LISTING = "listing"
+    DETAIL = "detail"
+
+    def __init__(self, directory: str) -> None:
+        self._objects_dir = os.path.join(directory, "objects")
+        self._index_dir = os.path.join(directory, "index")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._index_dir, exist_ok=True)
+        self._lock = Lock()
+
+    def store(self, url: str, content: bytes, kind: str, fetched_at: datetime = None) -> str:
+        """Stores page content (once per distinct content) and indexes its url and fetch time, returns content digest"""
+        fetched_at = fetched_at or datetime.now()
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._get_object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            tmp_path = f"{object_path}.{os.getpid()}.tmp"
+            with gzip.open(tmp_path, "wb") as object_file:
+                object_file.write(content)
+            os.replace(tmp_path, object_path)
+
+        entry = {"url": url, "kind": kind, "fetched_at": fetched_at.isoformat(), "digest": digest}
+        index_path = os.path.join(self._index_dir, f"{fetched_at:%Y-%m-%d}-{os.getpid()}.jsonl")
+        with self._lock, open(index_path, "a") as index_file:
+            index_file.write(json.dumps(entry) + "\n")
+        return digest
+
+    def load(self, digest: str) -> bytes:
+        """Returns decompressed page content by its digest"""
+        with gzip.open(self._get_object_path(digest), "rb") as object_file:
+            return object_file.read()
+
+    def iter_entries(self, since: datetime = None, until: datetime = None) -> Iterator[dict]:
+        """Yields index entries fetched between given datetimes ordered by their fetch time"""
+        entries = []
+        for index_name in sorted(os.listdir(self._index_dir)):
+            with open(os.path.join(self._index_dir, index_name)) as index_file:
+                entries += [json.loads(line) for line in index_file if line.strip()]
+        for entry in sorted(entries, key=lambda entry: entry["fetched_at"]):
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+            if (since is None or fetched_at >= since) and (until is None or fetched_at <= until):
+                yield {**entry, "fetched_at": fetched_at}
+
+    def _get_object_path(self, digest: str) -> str:
+        return os.path.join(self._objects_dir, digest[:2], f"{digest}.gz")
+
+
+_archive = None
+_archive_lock = Lock()
+
+
+def get_archive() -> PageArchive:
+    """Returns process-wide page archive, None when archiving is disabled"""
+    global _archive
+    if not ScraperConfig.ARCHIVE_DIR:
+        return None
+    with _archive_lock:
+        if _archive is None:
+            _archive = PageArchive(ScraperConfig.ARCHIVE_DIR)
+        return _archive
+
+
+def archive_page(url: str, content: bytes, kind: str) -> None:
+    """Stores fetched page in the archive when archiving is enabled, pages replayed from the corpus are not fetched"""
+    archive = get_archive()
+    if archive and ScraperConfig.HTTP_MODE != REPLAY:
+        archive.store(url, content, kind)
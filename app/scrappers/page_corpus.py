@@ -0,0 +1,36 @@
+import hashlib
+import json
+import os
+
+
+class PageCorpus:
+    """Local directory of recorded pages keyed by their full request URL"""
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, url: str, status_code: int, headers: dict, content: bytes) -> None:
+        """Stores recorded page content and its response metadata"""
+        key = self._get_key(url)
+        with open(self._get_path(key, ".html"), "wb") as page_file:
+            page_file.write(content)
+        with open(self._get_path(key, ".json"), "w") as meta_file:
+            json.dump({"url": url, "status_code": status_code, "headers": dict(headers)}, meta_file)
+
+    def load(self, url: str) -> tuple:
+        """Returns recorded (status code, headers, content) of the url, None if it was not recorded"""
+        key = self._get_key(url)
+        try:
+            with open(self._get_path(key, ".json")) as meta_file:
+                meta = json.load(meta_file)
+            with open(self._get_path(key, ".html"), "rb") as page_file:
+                return meta["status_code"], meta["headers"], page_file.read()
+        except OSError:
+            return None
+
+    def _get_key(self, url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _get_path(self, key: str, suffix: str) -> str:
+        return os.path.join(self._directory, f"{key}{suffix}")
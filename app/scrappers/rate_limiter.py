@@ -0,0 +1,100 @@
+import time
+from abc import ABC, abstractmethod
+from threading import Lock
+
+from config import Broker, ScraperConfig
+from redis import Redis
+
+
+class RateLimiter(ABC):
+    """Abstract per-domain token bucket rate limiter"""
+
+    def __init__(self, rates: dict, burst: int) -> None:
+        self._rates = rates
+        self._burst = burst
+
+    def acquire(self, domain: str) -> None:
+        """Blocks until request to the domain can be sent, domains without configured rate are not limited"""
+        rate = self._rates.get(domain)
+        if not rate:
+            return
+        while (wait_time := self._take_token(domain, rate)) > 0:
+            time.sleep(wait_time)
+
+    @abstractmethod
+    def _take_token(self, domain: str, rate: float) -> float:
+        """Takes token from the domain bucket, returns how long to wait for it when the bucket is empty"""
+        raise NotImplementedError
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Token bucket limiting requests rate of the current process"""
+
+    def __init__(self, rates: dict, burst: int) -> None:
+        super().__init__(rates, burst)
+        self._buckets = {domain: (float(burst), time.monotonic()) for domain in rates}
+        self._lock = Lock()
+
+    def _take_token(self, domain: str, rate: float) -> float:
+        with self._lock:
+            tokens, updated_at = self._buckets[domain]
+            now = time.monotonic()
+            tokens = min(self._burst, tokens + (now - updated_at) * rate)
+            if tokens >= 1:
+                self._buckets[domain] = (tokens - 1, now)
+                return 0
+            self._buckets[domain] = (tokens, now)
+            return (1 - tokens) / rate
+
+
+class RedisTokenBucketRateLimiter(RateLimiter):
+    """Token bucket kept in Redis, so the rate limit is shared by all scraper workers"""
+
+    KEY_PREFIX = "scraper-rate-limit:"
+    TAKE_TOKEN_SCRIPT = """
+        local tokens = tonumber(redis.call("HGET", KEYS[1], "tokens"))
+        local updated_at = tonumber(redis.call("HGET", KEYS[1], "updated_at"))
+        local rate, burst, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+        if tokens == nil then
+            tokens, updated_at = burst, now
+        end
+        tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate)
+        local wait_time = 0
+        if tokens >= 1 then
+            tokens = tokens - 1
+        else
+            wait_time = (1 - tokens) / rate
+        end
+        redis.call("HSET", KEYS[1], "tokens", tokens, "updated_at", now)
+        redis.call("EXPIRE", KEYS[1], math.ceil(burst / rate) + 1)
+        return tostring(wait_time)
+    """
+
+    def __init__(self, redis: Redis, rates: dict, burst: int) -> None:
+        super().__init__(rates, burst)
+        self._take_token_script = redis.register_script(self.TAKE_TOKEN_SCRIPT)
+
+    def _take_token(self, domain: str, rate: float) -> float:
+        wait_time = self._take_token_script(keys=[f"{self.KEY_PREFIX}{domain}"], args=[rate, self._burst, time.time()])
+        return float(wait_time)
+
+
+_rate_limiter = None
+_rate_limiter_lock = Lock()
+
+
+def make_rate_limiter() -> RateLimiter:
+    """Creates rate limiter of the configured type"""
+    if ScraperConfig.RATE_LIMITER == "local":
+        return TokenBucketRateLimiter(ScraperConfig.DOMAIN_RATE_LIMITS, ScraperConfig.RATE_LIMIT_BURST)
+    redis = Redis(host=Broker.HOST, port=Broker.PORT, db=Broker.DB or 0)
+    return RedisTokenBucketRateLimiter(redis, ScraperConfig.DOMAIN_RATE_LIMITS, ScraperConfig.RATE_LIMIT_BURST)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Returns process-wide rate limiter shared by all scrapers"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = make_rate_limiter()
+        return _rate_limiter
@@ -1,14 +1,145 @@
-from db.house_tools import add_new_houses
+from datetime import datetime
+
+from config import DBConfig, ScraperConfig, get_search
+from db.house_tools import add_new_houses_in_chunks, get_houses_datetimes
+from db.partition_tools import create_month_partitions
+from db.scrape_run_tools import (
+    complete_page,
+    finish_discovery,
+    finish_run_if_complete,
+    get_run,
+    pop_failed_offers,
+    schedule_pages,
+    start_or_resume_run,
+)
 from parsers import OLXContentParser
-from scrappers import HouseDataScraper
+from scrappers import HouseDataScraper, HouseDetailScraper, get_cache
 
 from app import celery
 
 
+def get_known_offers(offers: list, reference_time: datetime = None) -> dict:
+    """Maps websites of stored offers to whether their list page datetime has not changed since they were stored,
+    offers that fail to parse are left out, so their details are fetched and they go through the page subtask"""
+    stored_datetimes = get_houses_datetimes(offers)
+    known_offers = [dict(offer) for offer in offers if offer["website"] in stored_datetimes]
+    parsed_offers, _ = OLXContentParser(known_offers, reference_time).parse_with_failures()
+    return {
+        offer["website"]: _truncate_to_minutes(offer["datetime"])
+        <= _truncate_to_minutes(stored_datetimes[offer["website"]])
+        for offer in parsed_offers
+    }
+
+
+def _truncate_to_minutes(value):
+    """Drops seconds which are not present on the offer list page"""
+    return value.replace(second=0, microsecond=0)
+
+
+@celery.task()
+def download_olx_houses(search_name: str = None):
+    """Scans listing pages of the registered search from its last checkpoint and sends each page offers to a subtask
+    as soon as the page is scanned"""
+    search = get_search(search_name)
+    run = start_or_resume_run(search.name, ScraperConfig.RUN_RESUME_HOURS)
+    run_id, first_page, completed_pages = run.id, run.checkpoint_page + 1, set(run.completed_pages)
+    listed_at = datetime.now()  # offers relative dates of the whole run are resolved against the same moment
+    scraper = HouseDataScraper(search.url, known_offers_lookup=lambda offers: get_known_offers(offers, listed_at))
+    for page_num, page_offers, known_offers in scraper.discover_pages(first_page):
+        if page_num in completed_pages:
+            continue
+        schedule_pages(run_id, [page_num])
+        scrap_offers_page.apply_async(
+            (run_id, page_num, page_offers, known_offers, listed_at.isoformat()),
+            link_error=fail_offers_page.s(run_id, page_num),
+        )
+    scan_report = {
+        "search": search.name,
+        "run": run_id,
+        "resumed_from_page": first_page,
+        "pages_scanned": scraper.pages_scanned,
+        "stop_reason": scraper.stop_reason,
+    }
+    if finish_discovery(run_id):  # all pages were completed before the scan ended
+        summarize_scraping.delay(run_id)
+    return scan_report
+
+
+@celery.task(autoretry_for=(Exception,), max_retries=3, retry_backoff=True)
+def scrap_offers_page(run_id: int, page_num: int, offers: list, known_offers: dict, listed_at: str = None):
+    """Scraps details of single page offers, saves them to db and checkpoints the page, failed offers go to retry"""
+    cache = get_cache()
+    if cache:
+        cache.pop_stats()
+    offers, failed_offers = HouseDetailScraper().add_detail_data(offers, known_offers)
+    reference_time = datetime.fromisoformat(listed_at) if listed_at else None
+    houses, failed_parse_offers = OLXContentParser(offers, reference_time).parse_with_failures()
+    saved_counts = add_new_houses_in_chunks(houses, DBConfig.UPSERT_CHUNK_SIZE)
+    failed_offers = [
+        {**offer, "attempts": offer.get("attempts", 0) + 1, "listed_at": listed_at}
+        for offer in failed_offers + failed_parse_offers
+    ]
+    retry_offers = [offer for offer in failed_offers if offer["attempts"] < ScraperConfig.MAX_OFFER_ATTEMPTS]
+    page_result = {**saved_counts, "failed": len(failed_offers), "cache": cache.pop_stats() if cache else {}}
+    complete_page(run_id, page_num, retry_offers, page_result)
+    if finish_run_if_complete(run_id):
+        summarize_scraping.delay(run_id)
+    return page_result
+
+
+@celery.task()
+def fail_offers_page(request, exc, traceback, run_id: int, page_num: int = None):
+    """Error callback of the page subtask that failed for good, checkpoints the page with its offers going to retry
+    and finishes the run if it was its last pending page"""
+    print(f"Page {page_num} of run {run_id} failed: {exc!r}")
+    offers, listed_at = request.args[2], request.args[4] if len(request.args) > 4 else None
+    offers = [{**offer, "attempts": offer.get("attempts", 0) + 1, "listed_at": listed_at} for offer in offers]
+    retry_offers = [offer for offer in offers if offer["attempts"] < ScraperConfig.MAX_OFFER_ATTEMPTS]
+    page_result = {"created": 0, "updated": 0, "failed": len(offers), "cache": {}}
+    complete_page(run_id, page_num, retry_offers, page_result)
+    if finish_run_if_complete(run_id):
+        summarize_scraping.delay(run_id)
+
+
+@celery.task()
+def summarize_scraping(run_id: int):
+    """Sums up results of all page subtasks of a finished scraping run"""
+    run = get_run(run_id)
+    cache_stats = {}
+    for page_result in run.page_results:
+        for name, value in page_result["cache"].items():
+            cache_stats[name] = cache_stats.get(name, 0) + value
+    summary = {
+        "search": run.search_name,
+        "run": run.id,
+        "pages": len(set(run.completed_pages)),
+        "created": sum(result["created"] for result in run.page_results),
+        "updated": sum(result["updated"] for result in run.page_results),
+        "failed": sum(result["failed"] for result in run.page_results),
+        "cache": cache_stats,
+    }
+    print(f"Scraping finished: {summary}")
+    return summary
+
+
+@celery.task()
+def retry_failed_offers():
+    """Takes offers from runs retry lists and scraps them again, offers listed at the same moment are retried together
+    so their relative dates are resolved against the time of their listing"""
+    for run_id, offers in pop_failed_offers().items():
+        listed_offers = {}
+        for offer in offers:
+            listed_offers.setdefault(offer.get("listed_at"), []).append(offer)
+        for listed_at, offers in listed_offers.items():
+            print(f"Retrying {len(offers)} failed offers of run {run_id} listed at {listed_at}...")
+            scrap_offers_page.apply_async(
+                (run_id, None, offers, {}, listed_at), link_error=fail_offers_page.s(run_id, None)
+            )
+
+
 @celery.task()
-def download_olx_houses():
-    scraped_data = HouseDataScraper(
-        "https://www.olx.pl/nieruchomosci/mieszkania/sprzedaz/wielkopolskie/?search%5Bfilter_float_price%3Ato%5D=1000000/"
-    ).scrap()
-    data = OLXContentParser(scraped_data).parse()
-    print(add_new_houses(data))
+def create_houses_partitions():
+    """Creates monthly houses partitions for the current and upcoming months"""
+    created_partitions = create_month_partitions(DBConfig.PARTITION_MONTHS_AHEAD)
+    print(f"Created houses partitions: {created_partitions}")
+    return created_partitions
@@ -11,6 +11,7 @@ Containers:
     destroy                         stop and remove containers, networks, images, and volumes
     purge                           purge unused containers and images
     migrate                         migrate and upgrade postgres database
+    test                            run tests
     postgres                        run psql commands in the postgres container
 
 EOF
@@ -41,6 +42,9 @@ case "$1" in
     postgres)
         docker-compose exec postgres psql -U postgres
         ;;
+    test)
+        docker-compose run --rm web python -m pytest -q tests
+        ;;
 
 
     --help|-h)
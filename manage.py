@@ -11,9 +11,12 @@
 import os
 import signal
 import subprocess
+import sys
 
 import click
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "app"))
+
 
 # Ensure an environment variable exists and has a value
 def setenv(variable, default):
@@ -39,5 +42,112 @@ def flask(subcommand):
         p.wait()
 
 
+@cli.command("record-corpus")
+@click.option("--corpus", default=None, help="Directory for recorded pages (SCRAPER_CORPUS_DIR by default)")
+@click.option("--url", default=None, help="Search url (url of the first registered search by default)")
+@click.option("--max-pages", default=3, help="Number of listing pages to record")
+def record_corpus(corpus, url, max_pages):
+    """Scraps live pages and saves every fetched listing and detail page to a local corpus"""
+    from benchmark import record_corpus
+    from config import ScraperConfig, get_search
+
+    offers_count = record_corpus(url or get_search().url, corpus or ScraperConfig.CORPUS_DIR, max_pages)
+    click.echo(f"Recorded {offers_count} offers")
+
+
+@cli.command()
+@click.option("--corpus", default=None, help="Directory with recorded pages (SCRAPER_CORPUS_DIR by default)")
+@click.option("--url", default=None, help="Search url the corpus was recorded for (first registered search by default)")
+@click.option("--max-pages", default=3, help="Number of listing pages to replay")
+@click.option("--batch", is_flag=True, help="Parse offers with the vectorized batch mode")
+def benchmark(corpus, url, max_pages, batch):
+    """Replays recorded corpus through the scraper and the parser and reports their throughput"""
+    from benchmark import run_benchmark
+    from config import ScraperConfig, get_search
+
+    results = run_benchmark(url or get_search().url, corpus or ScraperConfig.CORPUS_DIR, max_pages, batch)
+    for name, value in results.items():
+        click.echo(f"{name}: {value}")
+
+
+@cli.command("reparse-archive")
+@click.option("--archive", default=None, help="Page archive directory (SCRAPER_ARCHIVE_DIR by default)")
+@click.option("--since", type=click.DateTime(), default=None, help="Reparse pages fetched since this datetime")
+@click.option("--until", type=click.DateTime(), default=None, help="Reparse pages fetched until this datetime")
+@click.option("--workers", type=int, default=None, help="Number of reparsing processes (CPU count by default)")
+@click.option("--bulk", is_flag=True, help="Save houses with COPY bulk ingest instead of chunked upserts")
+def reparse_archive(archive, since, until, workers, bulk):
+    """Re-runs detail strategies and parser over archived pages and upserts corrected houses"""
+    from app import app  # noqa: F401 pushes the app context with db
+    from config import ScraperConfig
+    from reparse import reparse_archive
+
+    saved_counts = reparse_archive(archive or ScraperConfig.ARCHIVE_DIR, since, until, workers, bulk)
+    click.echo(f"Reparsed and saved {saved_counts['created']} new and {saved_counts['updated']} updated houses")
+
+
+@cli.command("bulk-ingest")
+@click.argument("houses_file", type=click.File())
+@click.option("--chunk-size", type=int, default=None, help="Rows per COPY chunk (DB_COPY_CHUNK_SIZE by default)")
+def bulk_ingest(houses_file, chunk_size):
+    """Loads houses from JSON lines file (one parsed house per line) with COPY and merges them into the houses table"""
+    import json
+
+    from app import app  # noqa: F401 pushes the app context with db
+    from db.house_tools import bulk_ingest_houses
+
+    saved_counts = bulk_ingest_houses((json.loads(line) for line in houses_file if line.strip()), chunk_size)
+    click.echo(f"Ingested {saved_counts['created']} new and {saved_counts['updated']} updated houses")
+
+
+@cli.command("explain-queries")
+@click.option("--days", default=30, help="Length of the latest days window used by the queries")
+@click.option("--analyze", is_flag=True, help="Run the queries to report actual times and buffers")
+def explain_queries(days, analyze):
+    """Shows EXPLAIN plans of the standard dashboard queries"""
+    from app import app  # noqa: F401 pushes the app context with db
+    from db.query_report import explain_dashboard_queries
+
+    for name, plan in explain_dashboard_queries(days, analyze).items():
+        click.echo(f"--- {name}\n{plan}\n")
+
+
+@cli.command("benchmark-loader")
+@click.option("--days", default=30, help="Length of the latest days window to load")
+def benchmark_loader(days):
+    """Compares time and dataframe size of loading houses through ORM objects and through the columnar COPY path"""
+    from datetime import datetime, timedelta
+
+    import pandas as pd
+    from app import app  # noqa: F401 pushes the app context with db
+    from data_loaders.houses_snapshot import HOUSES_DTYPES
+    from db.house_tools import get_sql_conditions, read_houses_frame
+    from db.models import House
+    from db.query_report import measure_frame_load
+
+    filters = [("datetime", ">=", datetime.now() - timedelta(days=days))]
+    readers = {
+        "orm": lambda filters: pd.DataFrame(h.__dict__ for h in House.query.filter(*get_sql_conditions(filters))),
+        "columnar": lambda filters: read_houses_frame(filters, HOUSES_DTYPES),
+    }
+    for name, read_frame in readers.items():
+        click.echo(f"{name}: {measure_frame_load(read_frame, filters)}")
+
+
+@cli.command("detach-partitions")
+@click.option("--before", type=click.DateTime(["%Y-%m-%d"]), required=True, help="Detach months that end before it")
+@click.option("--archive-schema", default=None, help="Schema for detached partitions (DB_ARCHIVE_SCHEMA by default)")
+@click.option("--keep-schema", is_flag=True, help="Leave detached partitions in the current schema")
+def detach_partitions(before, archive_schema, keep_schema):
+    """Detaches cold monthly partitions of the houses table and moves them to the archive schema"""
+    from app import app  # noqa: F401 pushes the app context with db
+    from config import DBConfig
+    from db.partition_tools import detach_month_partitions
+
+    schema = None if keep_schema else archive_schema or DBConfig.ARCHIVE_SCHEMA
+    detached_partitions = detach_month_partitions(before.date(), schema)
+    click.echo(f"Detached {len(detached_partitions)} partitions: {', '.join(detached_partitions)}")
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,104 @@
+"""partition houses by month
+
+Revision ID: e8b3f6a1d9c4
+Revises: d4e7a9c2b6f1
+Create Date: 2026-10-18 16:41:09.872310
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e8b3f6a1d9c4"
+down_revision = "d4e7a9c2b6f1"
+branch_labels = None
+depends_on = None
+
+FILTER_INDEXES = {
+    "ix_houses_location_city_datetime": ["location_city", "datetime"],
+    "ix_houses_market_datetime": ["market", "datetime"],
+    "ix_houses_price": ["price"],
+    "ix_houses_area": ["area"],
+}
+
+
+def upgrade():
+    op.execute("ALTER TABLE houses RENAME TO houses_unpartitioned")
+    _drop_indexes("houses_unpartitioned")
+    op.drop_constraint("houses_name_website_key", "houses_unpartitioned", type_="unique")
+    op.drop_constraint("houses_pkey", "houses_unpartitioned", type_="primary")
+
+    op.create_table(  # partitioned table cannot keep (name, website) unique, so keys of houses are kept apart
+        "house_keys",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("website", sa.UnicodeText(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name", "website", name="house_keys_name_website_key"),
+    )
+    op.execute("INSERT INTO house_keys (id, name, website) SELECT id, name, website FROM houses_unpartitioned")
+    op.execute("SELECT setval('house_keys_id_seq', COALESCE((SELECT max(id) FROM house_keys), 0) + 1, false)")
+
+    op.execute(  # without defaults, ids of houses are taken from their keys
+        "CREATE TABLE houses (LIKE houses_unpartitioned, PRIMARY KEY (id, datetime)) PARTITION BY RANGE (datetime)"
+    )
+    op.execute("CREATE TABLE houses_default PARTITION OF houses DEFAULT")
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month_start timestamp;
+        BEGIN
+            FOR month_start IN SELECT generate_series(
+                (SELECT date_trunc('month', COALESCE(min(datetime), now())) FROM houses_unpartitioned),
+                date_trunc('month', now()) + interval '2 months',
+                interval '1 month'
+            ) LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF houses FOR VALUES FROM (%L) TO (%L)',
+                    'houses_y' || to_char(month_start, 'YYYY"m"MM'),
+                    month_start::date,
+                    (month_start + interval '1 month')::date
+                );
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute("INSERT INTO houses SELECT * FROM houses_unpartitioned")
+    op.drop_table("houses_unpartitioned")  # drops houses_id_seq owned by its id
+
+    op.create_index("ix_houses_name_website", "houses", ["name", "website"], unique=False)
+    _create_indexes("houses")
+
+
+def downgrade():
+    op.execute("ALTER TABLE houses RENAME TO houses_partitioned")
+    op.drop_index("ix_houses_name_website", table_name="houses_partitioned")
+    _drop_indexes("houses_partitioned")
+    op.drop_constraint("houses_pkey", "houses_partitioned", type_="primary")
+
+    op.execute("CREATE TABLE houses (LIKE houses_partitioned, PRIMARY KEY (id))")
+    op.execute("CREATE SEQUENCE houses_id_seq OWNED BY houses.id")
+    op.execute("ALTER TABLE houses ALTER COLUMN id SET DEFAULT nextval('houses_id_seq')")
+    op.execute(
+        "INSERT INTO houses SELECT DISTINCT ON (name, website) * FROM houses_partitioned "
+        "ORDER BY name, website, datetime DESC"
+    )
+    op.execute("SELECT setval('houses_id_seq', COALESCE((SELECT max(id) FROM houses), 0) + 1, false)")
+    op.execute("DROP TABLE houses_partitioned CASCADE")
+    op.drop_table("house_keys")
+
+    op.create_unique_constraint("houses_name_website_key", "houses", ["name", "website"])
+    _create_indexes("houses")
+
+
+def _create_indexes(table_name):
+    op.create_index("ix_houses_datetime_brin", table_name, ["datetime"], unique=False, postgresql_using="brin")
+    for index_name, columns in FILTER_INDEXES.items():
+        op.create_index(index_name, table_name, columns, unique=False)
+
+
+def _drop_indexes(table_name):
+    for index_name in FILTER_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+    op.drop_index("ix_houses_datetime_brin", table_name=table_name)
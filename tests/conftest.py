@@ -0,0 +1,46 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+@pytest.fixture
+def read_fixture():
+    """Returns function reading content of a saved page from the fixtures directory"""
+
+    def read(name: str) -> bytes:
+        with open(os.path.join(FIXTURES_DIR, name), "rb") as fixture_file:
+            return fixture_file.read()
+
+    return read
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Flask app bound to the database from TEST_DATABASE_URL, database tests are skipped when it is not set"""
+    database_url = os.environ.get("TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    from db.models import db
+    from flask import Flask
+
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI=database_url, SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture
+def database(app):
+    """Creates all tables before the test and drops them after it"""
+    from db.models import db
+
+    db.create_all()
+    yield db
+    db.session.remove()
+    db.drop_all()
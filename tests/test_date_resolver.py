@@ -0,0 +1,30 @@
+from datetime import datetime
+
+import pytest
+from parsers import DateResolver
+
+REFERENCE_TIME = datetime(2022, 1, 3, 10, 0)
+
+
+@pytest.mark.parametrize(
+    "date_text, expected",
+    [
+        ("dzisiaj 09:15", datetime(2022, 1, 3, 9, 15)),
+        ("wczoraj 23:40", datetime(2022, 1, 2, 23, 40)),
+        ("3 sty", datetime(2022, 1, 3)),
+        ("03 sty", datetime(2022, 1, 3)),
+        ("28 gru", datetime(2021, 12, 28)),  # december offers listed in january are from the previous year
+        ("4 sty", datetime(2021, 1, 4)),  # future day of the current year is the day a year ago
+    ],
+)
+def test_dates_are_resolved_against_reference_time(date_text, expected):
+    assert DateResolver(REFERENCE_TIME).resolve(date_text) == expected
+
+
+def test_yesterday_rolls_over_to_previous_year():
+    assert DateResolver(datetime(2022, 1, 1, 0, 30)).resolve("wczoraj 22:05") == datetime(2021, 12, 31, 22, 5)
+
+
+def test_unknown_date_text_raises_key_error():
+    with pytest.raises(KeyError):
+        DateResolver(REFERENCE_TIME).resolve("31 lut")
@@ -0,0 +1,57 @@
+import re
+
+import pytest
+from parsers import OLXContentParser
+from scrappers.house_detail_scraper import (
+    OlxHouseDetailStrategy,
+    OlxJsonHouseDetailStrategy,
+    OtodomHouseDetailStrategy,
+    OtodomJsonHouseDetailStrategy,
+)
+
+OLX_STATE = re.compile(rb"<script>window\.__PRERENDERED_STATE__.*?</script>", re.DOTALL)
+OTODOM_STATE = re.compile(rb'<script id="__NEXT_DATA__".*?</script>', re.DOTALL)
+EXPECTED_HOUSE = {"area": 48.0, "rooms_count": 2, "building_type": "Blok", "market": "Aftermarket"}
+
+
+def parse_detail_data(detail_data: dict) -> dict:
+    """Runs scraped detail data through the parser as a part of a listed offer"""
+    offer = {
+        "price_text": "599 000 zł",
+        "datetime_text": "14 paź",
+        "location_text": "Kraków, Krowodrza",
+        "website": "https://www.olx.pl/d/oferta/mieszkanie-CID3-IDabcd.html",
+        "name": "Mieszkanie 2 pokoje",
+        **detail_data,
+    }
+    house = OLXContentParser([offer]).parse()[0]
+    return {key: house[key] for key in EXPECTED_HOUSE}
+
+
+@pytest.mark.parametrize("strategy_class", [OlxHouseDetailStrategy, OlxJsonHouseDetailStrategy])
+def test_olx_strategies_scrap_detail_params(read_fixture, strategy_class):
+    detail_data = strategy_class().extract_data(read_fixture("olx_detail.html"))
+    assert parse_detail_data(detail_data) == EXPECTED_HOUSE
+
+
+def test_olx_json_strategy_falls_back_to_dom(read_fixture):
+    content = OLX_STATE.sub(b"", read_fixture("olx_detail.html"))
+    detail_data = OlxJsonHouseDetailStrategy().extract_data(content)
+    assert parse_detail_data(detail_data) == EXPECTED_HOUSE
+
+
+@pytest.mark.parametrize("strategy_class", [OtodomHouseDetailStrategy, OtodomJsonHouseDetailStrategy])
+def test_otodom_strategies_scrap_detail_params(read_fixture, strategy_class):
+    detail_data = strategy_class().extract_data(read_fixture("otodom_detail.html"))
+    assert parse_detail_data(detail_data) == {**EXPECTED_HOUSE, "building_type": "blok"}
+
+
+def test_otodom_json_strategy_falls_back_to_dom(read_fixture):
+    content = OTODOM_STATE.sub(b"", read_fixture("otodom_detail.html"))
+    detail_data = OtodomJsonHouseDetailStrategy().extract_data(content)
+    assert parse_detail_data(detail_data) == {**EXPECTED_HOUSE, "building_type": "blok"}
+
+
+def test_missing_params_are_empty():
+    detail_data = OlxHouseDetailStrategy().extract_data(b"<html><body><p>Opis</p></body></html>")
+    assert detail_data == {"area_text": "", "rooms_count_text": "", "building_type": "", "market": ""}
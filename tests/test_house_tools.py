@@ -0,0 +1,84 @@
+from datetime import datetime
+
+from db.house_tools import add_new_houses, bulk_ingest_houses, get_houses_datetimes
+from db.models import House
+
+WEBSITE = "https://www.olx.pl/d/oferta/mieszkanie-CID3-IDabcd.html"
+
+
+def make_house(house_datetime: datetime, price: float, **values) -> dict:
+    """Returns parsed house dict of the same offer with given datetime and price"""
+    return {
+        "name": "Mieszkanie 2 pokoje",
+        "website": WEBSITE,
+        "datetime": house_datetime,
+        "price": price,
+        "area": 48.0,
+        "rooms_count": 2,
+        "building_type": "Blok",
+        "location_city": "Kraków",
+        "location_region": "Krowodrza",
+        "market": "Aftermarket",
+        **values,
+    }
+
+
+def get_stored_house() -> House:
+    houses = House.query.all()
+    assert len(houses) == 1
+    return houses[0]
+
+
+def test_upsert_creates_and_updates_house(database):
+    assert add_new_houses([make_house(datetime(2021, 10, 10), 599000)]) == {"created": 1, "updated": 0}
+    assert add_new_houses([make_house(datetime(2021, 10, 12), 589000)]) == {"created": 0, "updated": 1}
+    house = get_stored_house()
+    assert (house.datetime, house.price) == (datetime(2021, 10, 12), 589000)
+
+
+def test_upsert_keeps_stored_values_missing_in_new_house(database):
+    add_new_houses([make_house(datetime(2021, 10, 10), 599000)])
+    add_new_houses([make_house(datetime(2021, 10, 12), 589000, area=None, market=None)])
+    house = get_stored_house()
+    assert (house.area, house.market) == (48.0, "Aftermarket")
+
+
+def test_upsert_does_not_count_unchanged_house(database):
+    add_new_houses([make_house(datetime(2021, 10, 10), 599000)])
+    assert add_new_houses([make_house(datetime(2021, 10, 10), 599000)]) == {"created": 0, "updated": 0}
+
+
+def test_upsert_keeps_latest_of_duplicated_houses(database):
+    houses = [make_house(datetime(2021, 10, 12), 589000), make_house(datetime(2021, 10, 10), 599000)]
+    assert add_new_houses(houses) == {"created": 1, "updated": 0}
+    assert get_stored_house().price == 589000
+
+
+def test_upsert_does_not_overwrite_newer_house(database):
+    add_new_houses([make_house(datetime(2021, 10, 12), 589000)])
+    assert add_new_houses([make_house(datetime(2021, 9, 1), 650000)]) == {"created": 0, "updated": 0}
+    house = get_stored_house()
+    assert (house.datetime, house.price) == (datetime(2021, 10, 12), 589000)
+
+
+def test_bulk_ingest_keeps_latest_of_duplicated_houses(database):
+    houses = [make_house(datetime(2021, 10, 10), 599000), make_house(datetime(2021, 10, 12), 589000)]
+    assert bulk_ingest_houses(houses) == {"created": 1, "updated": 0}
+    assert get_stored_house().price == 589000
+
+
+def test_bulk_ingest_does_not_overwrite_newer_house(database):
+    add_new_houses([make_house(datetime(2021, 10, 12), 589000)])
+    assert bulk_ingest_houses([make_house(datetime(2021, 9, 1), 650000)]) == {"created": 0, "updated": 0}
+    house = get_stored_house()
+    assert (house.datetime, house.price) == (datetime(2021, 10, 12), 589000)
+
+
+def test_houses_datetimes_are_looked_up_by_offer_name_and_website(database):
+    add_new_houses([make_house(datetime(2021, 10, 10), 599000)])
+    offers = [
+        {"name": "Mieszkanie 2 pokoje", "website": WEBSITE},
+        {"name": "Mieszkanie 3 pokoje", "website": "https://www.olx.pl/d/oferta/mieszkanie-CID3-IDefgh.html"},
+    ]
+    assert get_houses_datetimes(offers) == {WEBSITE: datetime(2021, 10, 10)}
+    assert get_houses_datetimes([]) == {}
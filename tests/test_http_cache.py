@@ -0,0 +1,30 @@
+import os
+
+from scrappers.http_cache import HttpCache
+
+
+def store_entries(cache_dir, count: int) -> None:
+    """Writes cache entries of 10 bytes bodies and metadata, the first entry is the least recently used"""
+    for num in range(count):
+        for suffix, content in ((HttpCache.BODY_SUFFIX, b"x" * 10), (HttpCache.META_SUFFIX, b"{}")):
+            path = cache_dir / f"key{num}{suffix}"
+            path.write_bytes(content)
+            os.utime(path, (num, num))
+
+
+def test_evict_removes_least_recently_used_entries(tmp_path):
+    store_entries(tmp_path, 3)
+    cache = HttpCache(str(tmp_path), ttl=60, max_size=12)
+    cache._evict()
+    assert sorted(os.listdir(tmp_path)) == ["key2.body", "key2.json"]
+
+
+def test_evict_skips_entries_removed_by_other_process(tmp_path, monkeypatch):
+    store_entries(tmp_path, 3)
+    cache = HttpCache(str(tmp_path), ttl=60, max_size=24)
+    scanned_entries = list(os.scandir(tmp_path))
+    for name in ("key0.body", "key0.json"):  # evicted by other process after the directory was scanned
+        os.remove(tmp_path / name)
+    monkeypatch.setattr(os, "scandir", lambda directory: iter(scanned_entries))
+    cache._evict()
+    assert sorted(os.listdir(tmp_path)) == ["key2.body", "key2.json"]
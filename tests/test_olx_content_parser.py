@@ -0,0 +1,72 @@
+from datetime import datetime
+
+import pytest
+from parsers import OLXContentParser
+
+REFERENCE_TIME = datetime(2022, 1, 3, 10, 0)
+OFFERS = [
+    {
+        "name": "Mieszkanie 2 pokoje",
+        "price_text": "650 000 zł",
+        "datetime_text": "dzisiaj 09:15",
+        "location_text": "Kraków, Krowodrza",
+        "website": "https://www.olx.pl/d/oferta/mieszkanie-CID3-IDabcd.html",
+        "area_text": " 48 m²",
+        "rooms_count_text": " 2 pokoje",
+        "building_type": " Blok",
+        "market": " Wtórny",
+    },
+    {
+        "name": "Mieszkanie 3 pokoje z balkonem",
+        "price_text": "799 000,50 zł",
+        "datetime_text": "28 gru",
+        "location_text": "Kraków",
+        "website": "https://www.otodom.pl/pl/oferta/mieszkanie-3-pokoje-ID4efgh",
+        "area_text": "62 m²",
+        "rooms_count_text": "3",
+        "building_type": "apartamentowiec",
+        "market": "pierwotny",
+    },
+    {  # known offer whose detail page was not scraped
+        "name": "Kawalerka",
+        "price_text": "349 000 zł",
+        "datetime_text": "wczoraj 18:40",
+        "location_text": "Kraków, Podgórze",
+        "website": "https://www.olx.pl/d/oferta/kawalerka-CID3-IDijkl.html",
+    },
+]
+
+
+def test_batch_parse_matches_row_by_row_parse():
+    row_houses = OLXContentParser(OFFERS, REFERENCE_TIME).parse()
+    batch_houses = OLXContentParser(OFFERS, REFERENCE_TIME).parse_batch()
+    assert batch_houses == row_houses
+
+
+def test_batch_parse_drops_offers_that_row_parse_fails_on():
+    offers = [
+        *OFFERS,
+        {**OFFERS[0], "datetime_text": "31 lut"},
+        {**OFFERS[1], "price_text": "799 000 zł do negocjacji"},
+        {**OFFERS[1], "price_text": "Zamienię"},
+    ]
+    row_houses, failed_offers = OLXContentParser(offers, REFERENCE_TIME).parse_with_failures()
+    assert failed_offers == offers[len(OFFERS) :]
+    assert OLXContentParser(offers, REFERENCE_TIME).parse_batch() == row_houses
+
+
+@pytest.mark.parametrize("parse", [OLXContentParser.parse, OLXContentParser.parse_batch])
+def test_offers_are_parsed_to_house_values(parse):
+    house = parse(OLXContentParser(OFFERS[:1], REFERENCE_TIME))[0]
+    assert house == {
+        "price": 650000,
+        "datetime": datetime(2022, 1, 3, 9, 15),
+        "location_city": "Kraków",
+        "location_region": " Krowodrza",
+        "area": 48.0,
+        "rooms_count": 2,
+        "website": OFFERS[0]["website"],
+        "name": "Mieszkanie 2 pokoje",
+        "building_type": "Blok",
+        "market": "Aftermarket",
+    }
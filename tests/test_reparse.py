@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import pytest
+from db.house_tools import add_new_houses
+from db.models import House
+from reparse import reparse_archive
+from scrappers.page_archive import PageArchive
+
+LISTING_URL = "https://www.olx.pl/nieruchomosci/mieszkania/sprzedaz/krakow/?page=1"
+OLX_WEBSITE = "https://www.olx.pl/d/oferta/mieszkanie-CID3-IDabcd.html"
+FETCHED_AT = datetime(2021, 9, 1, 10, 0)
+
+
+@pytest.fixture
+def archive_dir(tmp_path, read_fixture):
+    """Archive with a listing page fetched at FETCHED_AT and the detail page of its OLX offer"""
+    archive = PageArchive(str(tmp_path))
+    archive.store(OLX_WEBSITE, read_fixture("olx_detail.html"), PageArchive.DETAIL, FETCHED_AT)
+    archive.store(LISTING_URL, read_fixture("olx_listing.html"), PageArchive.LISTING, FETCHED_AT)
+    return str(tmp_path)
+
+
+def get_stored_houses() -> dict:
+    return {house.website: house for house in House.query.all()}
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_reparse_resolves_dates_against_fetch_time(database, archive_dir, bulk):
+    assert reparse_archive(archive_dir, workers=1, bulk=bulk) == {"created": 2, "updated": 0}
+    houses = get_stored_houses()
+    assert houses[OLX_WEBSITE].datetime == datetime(2021, 9, 1, 9, 15)
+    assert (houses[OLX_WEBSITE].area, houses[OLX_WEBSITE].market) == (48.0, "Aftermarket")
+    assert min(houses.values(), key=lambda house: house.datetime).datetime == datetime(2021, 8, 31, 18, 40)
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_reparse_does_not_overwrite_newer_houses(database, archive_dir, bulk):
+    newer_house = {
+        "name": "Mieszkanie 2 pokoje",
+        "website": OLX_WEBSITE,
+        "datetime": datetime(2021, 10, 12, 8, 0),
+        "price": 589000,
+        "area": 48.0,
+        "rooms_count": 2,
+        "building_type": "Blok",
+        "location_city": "Kraków",
+        "location_region": " Krowodrza",
+        "market": "Aftermarket",
+    }
+    add_new_houses([newer_house])
+    assert reparse_archive(archive_dir, workers=1, bulk=bulk) == {"created": 1, "updated": 0}
+    house = get_stored_houses()[OLX_WEBSITE]
+    assert (house.datetime, house.price) == (newer_house["datetime"], newer_house["price"])
@@ -0,0 +1,43 @@
+from db.scrape_run_tools import (
+    complete_page,
+    finish_discovery,
+    finish_run_if_complete,
+    get_run,
+    schedule_pages,
+    start_or_resume_run,
+)
+
+PAGE_RESULT = {"created": 2, "updated": 1, "failed": 0, "cache": {"hits": 3}}
+
+
+def test_run_is_not_finished_before_its_discovery_is_finished(database):
+    run_id = start_or_resume_run("krakow", resume_hours=12).id
+    schedule_pages(run_id, [1])
+    complete_page(run_id, 1, page_result=PAGE_RESULT)
+    assert not finish_run_if_complete(run_id)  # page 2 may still be discovered
+
+    schedule_pages(run_id, [2])
+    assert not finish_discovery(run_id)
+    complete_page(run_id, 2, page_result=PAGE_RESULT)
+    assert finish_run_if_complete(run_id)
+    run = get_run(run_id)
+    assert run.finished_at is not None
+    assert run.page_results == [PAGE_RESULT, PAGE_RESULT]
+
+
+def test_run_with_completed_pages_is_finished_with_its_discovery(database):
+    run_id = start_or_resume_run("krakow", resume_hours=12).id
+    assert finish_discovery(run_id)
+    assert not finish_run_if_complete(run_id)
+
+
+def test_resumed_run_discovers_its_pages_again(database):
+    run_id = start_or_resume_run("krakow", resume_hours=12).id
+    schedule_pages(run_id, [1, 2])
+    finish_discovery(run_id)
+    complete_page(run_id, 1)
+
+    assert start_or_resume_run("krakow", resume_hours=12).id == run_id
+    complete_page(run_id, 2)
+    assert not finish_run_if_complete(run_id)
+    assert finish_discovery(run_id)